@@ -0,0 +1,354 @@
+"""
+Binary store module for compact, memory-mapped storage of book collections.
+
+This module provides a compact binary file format for favorites as an
+alternative to pretty-printed JSON. Files are memory-mapped and records are
+decoded only when accessed, so opening a large library only reads the header.
+
+File layout (all integers little-endian):
+    Header (32 bytes): magic "JBF1", version (u16), reserved (u16),
+        record count (u32), string count (u32), string table offset (u64),
+        index offset (u64)
+    Records: each a u32 length followed by u32 string ids for title,
+        description, published date, info link, note and extra fields
+        (JSON of any other keys), a u16 author count and the author string ids
+    String table: (string count + 1) u64 offsets into the UTF-8 data that follows
+    Index: one u64 file offset per record
+
+Strings are stored once and shared between records (e.g. author names).
+Missing values use the id 0xFFFFFFFF.
+
+Conversion from the command line:
+    python -m app.functional.binary_store to-binary favorites/favorites.json favorites/favorites.jbf
+    python -m app.functional.binary_store to-json favorites/favorites.jbf favorites/favorites.json
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+
+MAGIC = b'JBF1'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIQQ')
+RECORD_FIELDS = struct.Struct('<IIIIIIH')
+NONE_ID = 0xFFFFFFFF
+
+# Keys stored in dedicated record fields; any other keys go into "extra"
+FIELDS = ('title', 'description', 'published_date', 'info_link', 'note')
+
+
+class BinaryFavoritesStore(Sequence):
+    """Read-only, memory-mapped view of a binary book collection.
+
+    Records are decoded into book dictionaries (as produced by Book.to_dict)
+    only when they are accessed.
+
+    Attributes:
+        filename (str): Path to the binary file
+    """
+
+    def __init__(self, filename):
+        """Open and memory-map a binary store.
+
+        Args:
+            filename (str): Path to the binary file
+
+        Raises:
+            ValueError: If the file is not a valid binary store
+        """
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{filename} is empty")
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{filename} is not a binary favorites store")
+        magic, version, _, self._count, self._string_count, self._strtab_offset, self._index_offset = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{filename} is not a binary favorites store")
+        self._strings_start = self._strtab_offset + (self._string_count + 1) * 8
+        if not self._layout_is_valid():
+            self.close()
+            raise ValueError(f"{filename} is truncated or corrupt")
+
+    def __len__(self):
+        """Get the number of records."""
+        return self._count
+
+    def __getitem__(self, index):
+        """Decode a record, or a list of records for a slice.
+
+        Args:
+            index (int | slice): Record position
+
+        Returns:
+            dict | list[dict]: The decoded book dictionary or dictionaries
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('record index out of range')
+        offset, = struct.unpack_from('<Q', self._map, self._index_offset + index * 8)
+        return self._decode_record(offset)
+
+    def title_and_authors(self, index):
+        """Decode only the title and authors of a record, for fast filtering.
+
+        Args:
+            index (int): Record position
+
+        Returns:
+            tuple: (title, list of authors)
+        """
+        offset, = struct.unpack_from('<Q', self._map, self._index_offset + index * 8)
+        ids = RECORD_FIELDS.unpack_from(self._map, offset + 4)
+        author_ids = struct.unpack_from(f'<{ids[-1]}I', self._map, offset + 4 + RECORD_FIELDS.size)
+        return self.string(ids[0]), [self.string(i) for i in author_ids]
+
+    def string(self, string_id):
+        """Decode a string from the string table.
+
+        Args:
+            string_id (int): String id
+
+        Returns:
+            str: The decoded string, or None for the missing-value id
+        """
+        if string_id == NONE_ID:
+            return None
+        start, end = struct.unpack_from('<QQ', self._map, self._strtab_offset + string_id * 8)
+        return self._map[self._strings_start + start:self._strings_start + end].decode('utf-8')
+
+    def close(self):
+        """Unmap and close the file."""
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def _layout_is_valid(self):
+        """Check that the string table and index described by the header fit in the file.
+
+        Only the section boundaries are checked, so opening a store stays
+        independent of its size; a truncated file always fails this check.
+        """
+        size = len(self._map)
+        if not HEADER.size <= self._strtab_offset <= self._strings_start <= size:
+            return False
+        strings_size, = struct.unpack_from('<Q', self._map, self._strings_start - 8)
+        return self._strings_start + strings_size <= self._index_offset and \
+            self._index_offset + self._count * 8 <= size
+
+    def _decode_record(self, offset):
+        """Decode the record stored at a file offset."""
+        *ids, extra_id, author_count = RECORD_FIELDS.unpack_from(self._map, offset + 4)
+        author_ids = struct.unpack_from(f'<{author_count}I', self._map, offset + 4 + RECORD_FIELDS.size)
+        book_data = {
+            'title': self.string(ids[0]),
+            'authors': [self.string(i) for i in author_ids],
+            'description': self.string(ids[1]),
+            'published_date': self.string(ids[2]),
+            'info_link': self.string(ids[3]),
+            'note': self.string(ids[4]),
+        }
+        if extra_id != NONE_ID:
+            book_data.update(json.loads(self.string(extra_id)))
+        return book_data
+
+
+def _encode_record(book_data, intern):
+    """Encode a book dictionary as a length-prefixed record.
+
+    Args:
+        book_data (dict): Book dictionary
+        intern (callable): Function returning the string id for a value
+
+    Returns:
+        bytes: The encoded record
+    """
+    extra = {k: v for k, v in book_data.items() if k not in FIELDS and k != 'authors'}
+    authors = book_data.get('authors') or []
+    payload = RECORD_FIELDS.pack(
+        *(intern(book_data.get(field)) for field in FIELDS),
+        intern(json.dumps(extra, ensure_ascii=False)) if extra else NONE_ID,
+        len(authors),
+    ) + struct.pack(f'<{len(authors)}I', *(intern(a) for a in authors))
+    return struct.pack('<I', len(payload)) + payload
+
+
+def _write(filename, records, base=None):
+    """Write a binary store, optionally starting from the contents of an existing one.
+
+    The records, strings and index of `base` are copied byte for byte, so
+    existing records keep their string ids and are never decoded.
+
+    Args:
+        filename (str): Path to the binary file
+        records (Iterable[dict]): Book dictionaries to store after those of `base`
+        base (BinaryFavoritesStore, optional): Store whose contents are copied first
+
+    Returns:
+        int: Total number of records written
+    """
+    strings = {}
+    string_data = []
+    first_id = base._string_count if base is not None else 0
+
+    def intern(value):
+        if value is None:
+            return NONE_ID
+        if value not in strings:
+            strings[value] = first_id + len(string_data)
+            string_data.append(value.encode('utf-8'))
+        return strings[value]
+
+    tmp_filename = f'{filename}.tmp'
+    index = []
+    with open(tmp_filename, 'wb') as f:
+        f.write(b'\0' * HEADER.size)
+        offset = HEADER.size
+        if base is not None:
+            f.write(base._map[HEADER.size:base._strtab_offset])
+            offset = base._strtab_offset
+        for book_data in records:
+            record = _encode_record(book_data, intern)
+            f.write(record)
+            index.append(offset)
+            offset += len(record)
+
+        strtab_offset = offset
+        offsets = [0]
+        base_strings = b''
+        if base is not None:
+            offsets = list(struct.unpack_from(f'<{base._string_count + 1}Q', base._map, base._strtab_offset))
+            base_strings = base._map[base._strings_start:base._strings_start + offsets[-1]]
+        position = offsets[-1]
+        for data in string_data:
+            position += len(data)
+            offsets.append(position)
+        f.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+        f.write(base_strings)
+        for data in string_data:
+            f.write(data)
+        index_offset = strtab_offset + len(offsets) * 8 + position
+        if base is not None:
+            f.write(base._map[base._index_offset:base._index_offset + len(base) * 8])
+        f.write(struct.pack(f'<{len(index)}Q', *index))
+
+        count = (len(base) if base is not None else 0) + len(index)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, count, len(offsets) - 1, strtab_offset, index_offset))
+    if base is not None:
+        # The base file must be unmapped before it can be replaced on all platforms
+        base.close()
+    os.replace(tmp_filename, filename)
+    return count
+
+
+def write_store(filename, records):
+    """Write book dictionaries to a binary store.
+
+    The file is written to a temporary path and then moved into place, so a
+    failed write never leaves a truncated store behind.
+
+    Args:
+        filename (str): Path to the binary file
+        records (Iterable[dict]): Book dictionaries to store
+
+    Returns:
+        int: Number of records written
+    """
+    return _write(filename, records)
+
+
+def append_records(store, records):
+    """Append book dictionaries to a binary store without decoding existing records.
+
+    The file is still rewritten as a whole, so appending costs O(n) bytes
+    copied, but existing records are copied as raw bytes instead of being
+    decoded and re-encoded. Strings of the new records are not shared with
+    existing ones until the store is rewritten with `write_store`. The store
+    is closed; open the file again to read the result.
+
+    Args:
+        store (BinaryFavoritesStore): Open store to append to
+        records (Iterable[dict]): Book dictionaries to append
+
+    Returns:
+        int: Total number of records in the store
+    """
+    return _write(store.filename, records, base=store)
+
+
+def is_binary_store(filename):
+    """Check whether a favorites path uses the binary format.
+
+    Args:
+        filename (str): Path to the favorites file
+
+    Returns:
+        bool: True for binary (.jbf) files
+    """
+    return filename.endswith('.jbf')
+
+
+def json_to_binary(json_filename, binary_filename):
+    """Convert a JSON favorites file into a binary store.
+
+    Args:
+        json_filename (str): Path to the JSON file
+        binary_filename (str): Path to the binary file to create
+
+    Returns:
+        int: Number of records converted
+    """
+    with open(json_filename, 'r', encoding='utf-8') as f:
+        return write_store(binary_filename, json.load(f))
+
+
+def binary_to_json(binary_filename, json_filename):
+    """Convert a binary store into a JSON favorites file.
+
+    Args:
+        binary_filename (str): Path to the binary file
+        json_filename (str): Path to the JSON file to create
+
+    Returns:
+        int: Number of records converted
+    """
+    store = BinaryFavoritesStore(binary_filename)
+    try:
+        with open(json_filename, 'w', encoding='utf-8') as f:
+            json.dump(list(store), f, indent=2)
+        return len(store)
+    finally:
+        store.close()
+
+
+def main():
+    """Command-line entry point for converting between JSON and binary favorites."""
+    parser = argparse.ArgumentParser(description="Convert favorites between JSON and the binary format")
+    parser.add_argument("direction", choices=["to-binary", "to-json"], help="Conversion direction")
+    parser.add_argument("source", help="File to convert")
+    parser.add_argument("target", help="File to create")
+    args = parser.parse_args()
+
+    if args.direction == "to-binary":
+        count = json_to_binary(args.source, args.target)
+    else:
+        count = binary_to_json(args.source, args.target)
+    print(f"Converted {count} books to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
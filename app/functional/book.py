@@ -19,9 +19,10 @@ class Book:
         published_date (str): Publication date of the book
         info_link (str): URL for more information about the book
         note (str, optional): User-added note about the book
+        language (str, optional): Language code of the book (e.g. 'en')
     """
     
-    def __init__(self, title, authors, description, published_date, info_link, note=None):
+    def __init__(self, title, authors, description, published_date, info_link, note=None, language=None):
         """Initialize a Book instance.
         
         Args:
@@ -31,6 +32,7 @@ class Book:
             published_date (str): Publication date of the book
             info_link (str): URL for more information about the book
             note (str, optional): User-added note about the book. Defaults to None.
+            language (str, optional): Language code of the book. Defaults to None.
         """
         self.title = title
         self.authors = authors
@@ -38,6 +40,7 @@ class Book:
         self.published_date = published_date
         self.info_link = info_link
         self.note = note
+        self.language = language
 
     def __str__(self):
         """Return a formatted string representation of the book.
@@ -66,7 +69,8 @@ class Book:
             'description': self.description,
             'published_date': self.published_date,
             'info_link': self.info_link,
-            'note': self.note
+            'note': self.note,
+            'language': self.language
         }
 
     @classmethod
@@ -85,5 +89,6 @@ class Book:
             description=data['description'],
             published_date=data['published_date'],
             info_link=data['info_link'],
-            note=data.get('note')
+            note=data.get('note'),
+            language=data.get('language')
         ) 
\ No newline at end of file
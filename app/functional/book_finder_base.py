@@ -6,8 +6,40 @@ functionality for all book finder implementations.
 """
 
 from abc import ABC, abstractmethod
-import logging
+import time
 from app.functional.book import Book
+from app.functional.dedup import deduplicate_books
+from app.functional.logging_config import get_logger, setup_logging
+from app.functional.metrics import metrics
+
+class SearchResults(list):
+    """A list of found books that remembers the size of the API response.
+    
+    When near-duplicates are dropped, a page can hold fewer books than the API
+    returned, so paging decisions should use `item_count` rather than the
+    length of the list.
+    
+    Attributes:
+        item_count (int): Number of items in the API response
+    """
+    
+    def __init__(self, books=(), item_count=None):
+        """Initialize the search results.
+        
+        Args:
+            books (Iterable[Book], optional): Found books
+            item_count (int, optional): Number of items in the API response. Defaults to the number of books.
+        """
+        super().__init__(books)
+        self.item_count = len(self) if item_count is None else item_count
+
+    def copy(self):
+        """Return a shallow copy that keeps the item count.
+        
+        Returns:
+            SearchResults: The copied results
+        """
+        return SearchResults(self, self.item_count)
 
 class BookFinderBase(ABC):
     """Abstract base class for book finder implementations.
@@ -18,29 +50,30 @@ class BookFinderBase(ABC):
     
     Attributes:
         logger (Logger): Logger instance for the book finder
+        dedupe_results (bool): Whether near-duplicate editions are dropped from responses
     """
     
-    def __init__(self):
-        """Initialize the book finder and set up logging."""
+    def __init__(self, dedupe_results=False):
+        """Initialize the book finder and set up logging.
+        
+        Args:
+            dedupe_results (bool, optional): Drop near-duplicate editions from responses. Defaults to False.
+        """
+        self.dedupe_results = dedupe_results
         self.setup_logging()
 
     def setup_logging(self):
         """Configure logging for the book finder.
         
-        Sets up a logger with both file and console handlers, using a standard
-        format for log messages.
+        Starts the shared queue-based logging pipeline (if not already running),
+        so log records are written by a background thread, and creates the
+        logger for this finder.
         """
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('book_finder.log'),
-                logging.StreamHandler()
-            ]
-        )
+        setup_logging()
+        self.logger = get_logger('finder')
 
     @abstractmethod
-    def search_books(self, query, title=None, author=None, lang=None):
+    def search_books(self, query, title=None, author=None, lang=None, start_index=0, max_results=None):
         """Search for books using the implemented finder.
         
         This is an abstract method that must be implemented by concrete classes.
@@ -52,6 +85,8 @@ class BookFinderBase(ABC):
             title (str, optional): Title to search for
             author (str, optional): Author to search for
             lang (str, optional): Language to filter by
+            start_index (int, optional): Index of the first result. Defaults to 0.
+            max_results (int, optional): Maximum number of results to return
             
         Returns:
             list[Book]: List of found books
@@ -71,9 +106,10 @@ class BookFinderBase(ABC):
             response (dict): API response data
             
         Returns:
-            list[Book]: List of processed Book objects
+            SearchResults: List of processed Book objects
         """
         books = []
+        start = time.perf_counter()
         try:
             items = response.get('items', [])
             for item in items:
@@ -83,11 +119,19 @@ class BookFinderBase(ABC):
                     authors=volume_info.get('authors', []),
                     description=volume_info.get('description', ''),
                     published_date=volume_info.get('publishedDate', ''),
-                    info_link=volume_info.get('infoLink', '')
+                    info_link=volume_info.get('infoLink', ''),
+                    language=volume_info.get('language')
                 )
                 books.append(book)
-            logging.info(f"Successfully processed {len(books)} books")
-            return books
+            if self.dedupe_results:
+                count = len(books)
+                books = deduplicate_books(books)
+                metrics.inc('duplicates_dropped_total', count - len(books))
+            metrics.observe('parse_duration_seconds', time.perf_counter() - start)
+            metrics.inc('books_parsed_total', len(books))
+            self.logger.info(f"Successfully processed {len(books)} books")
+            return SearchResults(books, len(items))
         except Exception as e:
-            logging.error(f"Error processing response: {str(e)}")
-            return [] 
\ No newline at end of file
+            metrics.inc('parse_errors_total')
+            self.logger.error(f"Error processing response: {str(e)}")
+            return SearchResults() 
\ No newline at end of file
@@ -0,0 +1,287 @@
+"""
+Crawler module for building a local catalog from the Google Books API.
+
+This module provides the CrawlJob class which pages through all results for a
+list of seed queries, de-duplicates volumes by their id and appends them to a
+local JSON-lines catalog. Progress is checkpointed after every page, so an
+interrupted crawl resumes where it stopped without refetching pages.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from app.functional.logging_config import get_logger
+from app.functional.metrics import metrics
+
+# Largest page size accepted by the volumes endpoint
+CRAWL_PAGE_SIZE = 40
+# HTTP statuses worth retrying after a pause
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CrawlJob:
+    """A resumable crawl of all results for a list of seed queries.
+
+    The catalog is append-only: each line holds one volume as returned by the
+    API, plus the seed that found it. The checkpoint records, per seed, the
+    index of the next page to fetch and whether the seed is finished, along
+    with the number of requests used so far.
+
+    Attributes:
+        finder (GoogleBooksFinder): Finder whose pooled session is used for requests
+        seeds (list[str]): Seed queries to crawl
+        catalog_path (str): Path to the JSON-lines catalog
+        checkpoint_path (str): Path to the checkpoint file
+        workers (int): Number of seeds crawled concurrently
+        quota (int): Maximum number of API requests, including earlier runs
+        max_retries (int): Retries for throttled or failed requests
+    """
+
+    def __init__(self, finder, seeds, catalog_path='catalog/catalog.jsonl', checkpoint_path=None,
+                 workers=4, quota=1000, max_retries=3, retry_delay=1.0):
+        """Initialize the crawl job and load any previous progress.
+
+        Args:
+            finder (GoogleBooksFinder): Finder whose pooled session is used for requests
+            seeds (list[str]): Seed queries to crawl
+            catalog_path (str, optional): Path to the catalog. Defaults to 'catalog/catalog.jsonl'.
+            checkpoint_path (str, optional): Path to the checkpoint. Defaults to the catalog path with '.checkpoint.json'.
+            workers (int, optional): Seeds crawled concurrently. Defaults to 4.
+            quota (int, optional): Maximum API requests across runs. Defaults to 1000 (the API's default daily quota).
+            max_retries (int, optional): Retries for throttled or failed requests. Defaults to 3.
+            retry_delay (float, optional): Initial retry delay in seconds, doubled per retry. Defaults to 1.0.
+        """
+        self.finder = finder
+        # Repeated seeds would share one checkpoint entry across workers, so keep only the first
+        self.seeds = list(dict.fromkeys(seed.strip() for seed in seeds if seed.strip()))
+        self.catalog_path = catalog_path
+        self.checkpoint_path = checkpoint_path or f'{os.path.splitext(catalog_path)[0]}.checkpoint.json'
+        self.workers = workers
+        self.quota = quota
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.logger = get_logger('crawler')
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.checkpoint = self.load_checkpoint()
+        self.seen_ids = self.load_seen_ids()
+        self.fetched = 0
+        self.added = 0
+        self.requests = 0
+        self.started_at = None
+        self._catalog = None
+
+    def load_checkpoint(self):
+        """Load the checkpoint of a previous run.
+
+        Returns:
+            dict: Checkpoint data with 'seeds' progress and 'requests' used
+        """
+        if os.path.exists(self.checkpoint_path):
+            try:
+                with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                self.logger.warning(f"Ignoring unreadable checkpoint {self.checkpoint_path}")
+        return {'seeds': {}, 'requests': 0}
+
+    def load_seen_ids(self):
+        """Collect the ids of volumes already in the catalog.
+
+        A line cut short by an interruption is skipped; its volume is fetched
+        again because the checkpoint is only advanced after a page is written.
+
+        Returns:
+            set[str]: Volume ids already stored
+        """
+        seen = set()
+        if os.path.exists(self.catalog_path):
+            with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        seen.add(json.loads(line)['id'])
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+        return seen
+
+    def trim_partial_line(self):
+        """Cut off a catalog line left incomplete by an interruption, so appends start on a new line."""
+        if not os.path.exists(self.catalog_path):
+            return
+        with open(self.catalog_path, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            end = size
+            while end > 0:
+                start = max(end - 4096, 0)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b'\n')
+                if newline != -1:
+                    end = start + newline + 1
+                    break
+                end = start
+            if end != size:
+                f.truncate(end)
+
+    def save_checkpoint(self):
+        """Write the checkpoint atomically. Must be called with the lock held."""
+        tmp_path = f'{self.checkpoint_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.checkpoint, f, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def remaining_quota(self):
+        """Get the number of API requests still allowed.
+
+        Returns:
+            int: Remaining requests
+        """
+        return max(self.quota - self.checkpoint['requests'], 0)
+
+    def stats(self):
+        """Get live progress statistics.
+
+        Returns:
+            dict: Counts of fetched and new volumes, requests, throughput,
+                remaining quota and finished seeds
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+            seeds = self.checkpoint['seeds']
+            return {
+                'fetched': self.fetched,
+                'added': self.added,
+                'catalog_size': len(self.seen_ids),
+                'requests': self.requests,
+                'elapsed': elapsed,
+                'volumes_per_second': self.fetched / elapsed if elapsed else 0.0,
+                'remaining_quota': self.remaining_quota(),
+                'seeds_done': sum(1 for seed in self.seeds if seeds.get(seed, {}).get('done')),
+                'seeds_total': len(self.seeds),
+            }
+
+    def stop(self):
+        """Ask the crawl to stop after the pages currently being fetched."""
+        self._stop.set()
+
+    def run(self):
+        """Crawl all unfinished seeds, resuming from the checkpoint.
+
+        Returns:
+            dict: Final progress statistics
+        """
+        os.makedirs(os.path.dirname(self.catalog_path) or '.', exist_ok=True)
+        self.started_at = time.monotonic()
+        pending = [seed for seed in self.seeds if not self.checkpoint['seeds'].get(seed, {}).get('done')]
+        self.trim_partial_line()
+        self._catalog = open(self.catalog_path, 'a', encoding='utf-8')
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='crawl')
+        try:
+            for future in [executor.submit(self.crawl_seed, seed) for seed in pending]:
+                future.result()
+        except KeyboardInterrupt:
+            self.stop()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+            self._catalog.close()
+            self._catalog = None
+            # Requests spent on failed pages are not saved by store_page
+            with self._lock:
+                self.save_checkpoint()
+        return self.stats()
+
+    def crawl_seed(self, seed):
+        """Fetch all remaining pages for one seed query.
+
+        Args:
+            seed (str): Seed query
+        """
+        with self._lock:
+            progress = self.checkpoint['seeds'].setdefault(seed, {'next_index': 0, 'done': False})
+
+        while not self._stop.is_set():
+            data = self.fetch_page(seed, progress['next_index'])
+            if data is None:
+                return
+            items = data.get('items', [])
+            self.store_page(seed, progress, items)
+            if not items:
+                return
+
+    def fetch_page(self, seed, start_index):
+        """Fetch one page of raw results, retrying throttled and failed requests.
+
+        Args:
+            seed (str): Seed query
+            start_index (int): Index of the first result
+
+        Returns:
+            dict: Decoded API response, or None if the page could not be fetched
+        """
+        params = self.finder.build_params(seed, start_index=start_index, max_results=CRAWL_PAGE_SIZE)
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            if not self._use_request():
+                return None
+            try:
+                return self.finder.fetch_volumes(params)
+            except requests.exceptions.RequestException as e:
+                status = e.response.status_code if e.response is not None else None
+                retryable = status is None or status in RETRY_STATUSES
+                if not retryable or attempt == self.max_retries or self._stop.is_set():
+                    self.logger.error(f"Crawl of '{seed}' stopped at index {start_index}: {str(e)}")
+                    with self._lock:
+                        self.save_checkpoint()
+                    return None
+                metrics.inc('crawl_retries_total')
+                time.sleep(delay)
+                delay *= 2
+        return None
+
+    def store_page(self, seed, progress, items):
+        """Append new volumes to the catalog and advance the checkpoint.
+
+        Args:
+            seed (str): Seed query the page belongs to
+            progress (dict): Checkpoint progress of the seed
+            items (list[dict]): Volumes on the page
+        """
+        with self._lock:
+            lines = []
+            for item in items:
+                volume_id = item.get('id')
+                if volume_id and volume_id not in self.seen_ids:
+                    self.seen_ids.add(volume_id)
+                    lines.append(json.dumps({'seed': seed, **item}, ensure_ascii=False) + '\n')
+            if lines:
+                self._write(''.join(lines))
+            self.fetched += len(items)
+            self.added += len(lines)
+            # The API may return fewer items than requested on pages that are not
+            # the last one, so the next page always starts a full page later
+            progress['next_index'] += CRAWL_PAGE_SIZE
+            progress['done'] = not items
+            self.save_checkpoint()
+        metrics.inc('crawl_volumes_fetched_total', len(items))
+        metrics.inc('crawl_volumes_added_total', len(lines))
+
+    def _use_request(self):
+        """Count a request against the quota, stopping the crawl once it is used up."""
+        with self._lock:
+            if self.remaining_quota() <= 0:
+                if not self._stop.is_set():
+                    self.logger.warning("Request quota exhausted, stopping crawl")
+                self._stop.set()
+                return False
+            self.checkpoint['requests'] += 1
+            self.requests += 1
+            return True
+
+    def _write(self, data):
+        """Append data to the catalog and flush it to disk before checkpointing."""
+        self._catalog.write(data)
+        self._catalog.flush()
+        os.fsync(self._catalog.fileno())
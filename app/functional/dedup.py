@@ -0,0 +1,409 @@
+"""
+Dedup module for detecting and merging near-duplicate books.
+
+Google Books returns many editions of the same work that differ in subtitle,
+publication date or author spelling. This module groups such near-duplicates
+using normalized keys plus MinHash signatures with locality-sensitive hashing
+(LSH), so only books that share a hash band are ever compared. This keeps the
+work roughly linear in the number of books instead of quadratic. Signatures for
+large collections are computed across a process pool.
+"""
+
+import re
+import unicodedata
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+NUM_PERM = 32
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+# Collections at least this large compute signatures in a process pool
+PARALLEL_THRESHOLD = 5000
+CHUNK_SIZE = 2000
+# Number of description words used for similarity
+DESCRIPTION_WORDS = 40
+
+_EDITION_RE = re.compile(r'[\(\[][^\)\]]*(edition|ed\.|reprint)[^\)\]]*[\)\]]', re.IGNORECASE)
+_SUBTITLE_RE = re.compile(r':| - | — ')
+_NUMBER_RE = re.compile(r'\b\d+\b')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_ARTICLES = ('the ', 'a ', 'an ')
+
+
+def normalize_text(text):
+    """Lowercase text, strip accents and punctuation, and collapse whitespace.
+
+    Args:
+        text (str): Text to normalize
+
+    Returns:
+        str: Normalized text
+    """
+    text = text or ''
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join(c for c in text if not unicodedata.combining(c))
+    text = _PUNCT_RE.sub(' ', text.lower().replace('&', ' and '))
+    return ' '.join(text.split())
+
+
+def _strip_article(text):
+    """Remove a leading article from normalized text."""
+    for article in _ARTICLES:
+        if text.startswith(article):
+            return text[len(article):]
+    return text
+
+
+def split_title(title):
+    """Split a title into its normalized main title and subtitle.
+
+    Edition markers such as "(2nd Edition)" are dropped, but volume numbers
+    are kept, since they tell different works in a series apart.
+
+    Args:
+        title (str): Book title
+
+    Returns:
+        tuple: (normalized main title, normalized subtitle or '')
+    """
+    parts = _SUBTITLE_RE.split(_EDITION_RE.sub(' ', title or ''), maxsplit=1)
+    main = _strip_article(normalize_text(parts[0]))
+    subtitle = _strip_article(normalize_text(parts[1])) if len(parts) > 1 else ''
+    return main, subtitle
+
+
+def normalize_title(title):
+    """Normalize a title to its main part, without subtitle, edition markers or leading article.
+
+    Args:
+        title (str): Book title
+
+    Returns:
+        str: Normalized main title
+    """
+    return split_title(title)[0]
+
+
+def title_numbers(main, subtitle):
+    """Get the numbers in a normalized title (e.g. volume or part numbers).
+
+    Args:
+        main (str): Normalized main title
+        subtitle (str): Normalized subtitle
+
+    Returns:
+        frozenset[str]: Numbers appearing in the title
+    """
+    return frozenset(_NUMBER_RE.findall(f'{main} {subtitle}'))
+
+
+def titles_compatible(sig_a, sig_b):
+    """Check whether two books' titles allow them to be the same work.
+
+    Titles with different numbers (e.g. "Volume 1" and "Volume 2") or
+    clearly different subtitles (e.g. two parts of a trilogy) never match.
+    A missing subtitle matches any subtitle.
+
+    Args:
+        sig_a (tuple): Entry of the first book from compute_signatures
+        sig_b (tuple): Entry of the second book from compute_signatures
+
+    Returns:
+        bool: True if the titles may belong to the same work
+    """
+    if sig_a[2] != sig_b[2]:
+        return False
+    subtitle_a, subtitle_b = set(sig_a[1].split()), set(sig_b[1].split())
+    if not subtitle_a or not subtitle_b:
+        return True
+    return len(subtitle_a & subtitle_b) / len(subtitle_a | subtitle_b) >= 0.5
+
+
+def author_surname(name):
+    """Get the normalized surname of an author ("Tolkien, J.R.R." and "J. R. R. Tolkien" both give "tolkien").
+
+    Args:
+        name (str): Author name
+
+    Returns:
+        str: Normalized surname
+    """
+    if ',' in (name or ''):
+        name = name.split(',', 1)[0]
+    words = normalize_text(name).split()
+    return words[-1] if words else ''
+
+
+def book_tokens(title, surnames, description):
+    """Get the token sets used for similarity of a book.
+
+    Args:
+        title (str): Normalized main title
+        surnames (list[str]): Normalized author surnames
+        description (str): Book description
+
+    Returns:
+        tuple: (core tokens from title trigrams and author surnames, description word shingles)
+    """
+    core = {title[i:i + 3] for i in range(max(len(title) - 2, 1))}
+    core.update('a:' + surname for surname in surnames)
+    words = normalize_text(description).split()[:DESCRIPTION_WORDS]
+    shingles = {' '.join(words[i:i + 3]) for i in range(len(words) - 2)}
+    return core, shingles
+
+
+def minhash(tokens):
+    """Compute the MinHash signature of a token set.
+
+    Uses one-permutation hashing: each token is hashed once and its hash is
+    assigned to one of NUM_PERM bins, keeping the minimum per bin. Empty bins
+    borrow the value of the next filled bin (rotation densification), so the
+    cost is one hash per token instead of NUM_PERM.
+
+    Args:
+        tokens (set[str]): Tokens to hash
+
+    Returns:
+        tuple[int]: Signature with NUM_PERM values, or None for an empty set
+    """
+    if not tokens:
+        return None
+    bins = [None] * NUM_PERM
+    for token in tokens:
+        data = token.encode('utf-8')
+        value = (zlib.crc32(data) << 32) | zlib.crc32(data, 0x9E3779B9)
+        index = value % NUM_PERM
+        value //= NUM_PERM
+        if bins[index] is None or value < bins[index]:
+            bins[index] = value
+    signature = list(bins)
+    for i in range(NUM_PERM):
+        if bins[i] is None:
+            distance = 1
+            while bins[(i + distance) % NUM_PERM] is None:
+                distance += 1
+            signature[i] = (distance << 60) + bins[(i + distance) % NUM_PERM]
+    return tuple(signature)
+
+
+def compute_signatures(records):
+    """Compute normalized keys and signatures for a batch of book dictionaries.
+
+    Args:
+        records (list[dict]): Book dictionaries
+
+    Returns:
+        list[tuple]: (main title, subtitle, title numbers, author surnames, core signature,
+            description signature) per book
+    """
+    result = []
+    for book_data in records:
+        title, subtitle = split_title(book_data.get('title'))
+        surnames = [surname for surname in map(author_surname, book_data.get('authors') or []) if surname]
+        core, description = book_tokens(title, surnames, book_data.get('description'))
+        result.append((title, subtitle, title_numbers(title, subtitle), surnames,
+                       minhash(core), minhash(description)))
+    return result
+
+
+def similarity(sig_a, sig_b):
+    """Estimate the Jaccard similarity of two MinHash signatures.
+
+    Args:
+        sig_a (tuple[int]): First signature
+        sig_b (tuple[int]): Second signature
+
+    Returns:
+        float: Estimated similarity (0.0-1.0), 0.0 if either is missing
+    """
+    if sig_a is None or sig_b is None:
+        return 0.0
+    return sum(a == b for a, b in zip(sig_a, sig_b)) / NUM_PERM
+
+
+class _UnionFind:
+    """Disjoint sets of record indices."""
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+class MergeReport:
+    """Result of merging duplicate books.
+
+    Attributes:
+        groups (list[tuple[dict, list[dict]]]): Merged book and the duplicates folded into it
+        original_count (int): Number of books before merging
+        merged_count (int): Number of books after merging
+    """
+
+    def __init__(self, groups, original_count, merged_count):
+        """Initialize the merge report.
+
+        Args:
+            groups (list[tuple[dict, list[dict]]]): Merged book and the duplicates folded into it
+            original_count (int): Number of books before merging
+            merged_count (int): Number of books after merging
+        """
+        self.groups = groups
+        self.original_count = original_count
+        self.merged_count = merged_count
+
+    def __str__(self):
+        """Return a readable summary of the merged groups.
+
+        Returns:
+            str: One line per merged group
+        """
+        lines = [f"Merged {self.original_count} books into {self.merged_count} "
+                 f"({len(self.groups)} duplicate group(s))"]
+        for merged, duplicates in self.groups:
+            lines.append(f"- {merged['title']}: merged {len(duplicates)} duplicate(s)")
+        return '\n'.join(lines)
+
+
+def find_duplicates(records, threshold=0.6, description_threshold=0.8, workers=None):
+    """Find groups of near-duplicate books.
+
+    Books are candidates when they share a normalized title/author key or any
+    LSH band of their MinHash signatures. Candidates are confirmed only when
+    they share an author, their titles are compatible (same volume numbers and
+    no clearly different subtitles), and their title/author similarity
+    reaches `threshold` or their description similarity reaches
+    `description_threshold`. Books without authors are never merged.
+
+    Args:
+        records (Sequence[dict]): Book dictionaries
+        threshold (float, optional): Minimum title/author similarity. Defaults to 0.6.
+        description_threshold (float, optional): Minimum description similarity. Defaults to 0.8.
+        workers (int, optional): Worker processes for large collections. Defaults to the CPU count.
+
+    Returns:
+        list[list[int]]: Groups of record indices (each with at least two books), in record order
+    """
+    records = list(records)
+    if len(records) >= PARALLEL_THRESHOLD and workers != 1:
+        chunks = [records[i:i + CHUNK_SIZE] for i in range(0, len(records), CHUNK_SIZE)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            signatures = [sig for chunk in executor.map(compute_signatures, chunks) for sig in chunk]
+    else:
+        signatures = compute_signatures(records)
+
+    surnames = [set(signature[3]) for signature in signatures]
+    buckets = {}
+    for i, (title, _, _, book_surnames, core, description) in enumerate(signatures):
+        if title and book_surnames:
+            buckets.setdefault(('key', title, book_surnames[0]), []).append(i)
+        for kind, signature in (('core', core), ('description', description)):
+            if signature is not None:
+                for band in range(BANDS):
+                    rows = signature[band * ROWS:(band + 1) * ROWS]
+                    buckets.setdefault((kind, band, rows), []).append(i)
+
+    sets = _UnionFind(len(records))
+    for key, members in buckets.items():
+        if len(members) < 2:
+            continue
+        # Compare each member with the first one only, so large buckets stay linear
+        first = members[0]
+        for other in members[1:]:
+            if sets.find(first) == sets.find(other):
+                continue
+            if not surnames[first] & surnames[other]:
+                continue
+            if not titles_compatible(signatures[first], signatures[other]):
+                continue
+            if (similarity(signatures[first][4], signatures[other][4]) >= threshold
+                    or similarity(signatures[first][5], signatures[other][5]) >= description_threshold):
+                sets.union(first, other)
+
+    groups = {}
+    for i in range(len(records)):
+        groups.setdefault(sets.find(i), []).append(i)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def merge_group(group):
+    """Merge duplicate book dictionaries into one.
+
+    The most complete record is kept, missing fields are filled in from the
+    others and distinct notes are combined.
+
+    Args:
+        group (list[dict]): Duplicate book dictionaries
+
+    Returns:
+        dict: The merged book dictionary
+    """
+    def completeness(book_data):
+        return (sum(1 for v in book_data.values() if v), len(book_data.get('description') or ''))
+
+    merged = dict(max(group, key=completeness))
+    for book_data in group:
+        for key, value in book_data.items():
+            if value and not merged.get(key):
+                merged[key] = value
+    notes = []
+    for book_data in group:
+        if book_data.get('note') and book_data['note'] not in notes:
+            notes.append(book_data['note'])
+    merged['note'] = ' | '.join(notes) if notes else None
+    return merged
+
+
+def deduplicate(records, threshold=0.6, workers=None):
+    """Merge near-duplicate book dictionaries.
+
+    Each group of duplicates is replaced by a merged record at the position of
+    its first member.
+
+    Args:
+        records (Sequence[dict]): Book dictionaries
+        threshold (float, optional): Minimum title/author similarity. Defaults to 0.6.
+        workers (int, optional): Worker processes for large collections
+
+    Returns:
+        tuple: (list of deduplicated book dictionaries, MergeReport)
+    """
+    records = list(records)
+    groups = find_duplicates(records, threshold, workers=workers)
+    replaced = {}
+    dropped = set()
+    report_groups = []
+    for group in groups:
+        duplicates = [records[i] for i in group]
+        merged = merge_group(duplicates)
+        replaced[group[0]] = merged
+        dropped.update(group[1:])
+        report_groups.append((merged, duplicates))
+
+    result = [replaced.get(i, book_data) for i, book_data in enumerate(records) if i not in dropped]
+    return result, MergeReport(report_groups, len(records), len(result))
+
+
+def deduplicate_books(books, threshold=0.6):
+    """Drop near-duplicate editions from a list of Book objects, keeping the first of each.
+
+    Args:
+        books (list[Book]): Books, e.g. search results in relevance order
+        threshold (float, optional): Minimum title/author similarity. Defaults to 0.6.
+
+    Returns:
+        list[Book]: Books without near-duplicates, in their original order
+    """
+    groups = find_duplicates([book.to_dict() for book in books], threshold, workers=1)
+    dropped = {i for group in groups for i in group[1:]}
+    return [book for i, book in enumerate(books) if i not in dropped]
+
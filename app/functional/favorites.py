@@ -3,14 +3,37 @@ FavoritesManager module for managing user's favorite books.
 
 This module provides functionality for managing a user's favorite books, including
 adding, removing, filtering, and exporting favorites. It also handles recent book
-tracking and persistence to JSON files.
+tracking and persistence to JSON files, or to a compact memory-mapped binary
+store when the favorites filename ends in ".jbf".
 """
 
+import atexit
 import json
 import os
 import csv
+import time
 from datetime import datetime
+from app.functional.binary_store import BinaryFavoritesStore, append_records, is_binary_store, write_store
 from app.functional.book import Book
+from app.functional.dedup import deduplicate
+from app.functional.favorites_index import FavoritesIndex
+from app.functional.metrics import THROUGHPUT_BUCKETS, metrics, traced
+from app.functional.recent_books import RecentBooks
+
+# Fields compared to decide whether a book is already in favorites
+BOOK_FIELDS = ('title', 'authors', 'description', 'published_date', 'info_link', 'note')
+
+def favorite_key(title, authors):
+    """Get the key used to look up possible duplicates of a favorite.
+    
+    Args:
+        title (str): Book title
+        authors (list[str]): Book authors
+        
+    Returns:
+        tuple: (title, tuple of authors)
+    """
+    return title, tuple(authors or ())
 
 class FavoritesManager:
     """A class for managing user's favorite books and recently viewed books.
@@ -20,30 +43,56 @@ class FavoritesManager:
     viewed books and handles data persistence to JSON files.
     
     Attributes:
-        filename (str): Path to the favorites JSON file
+        filename (str): Path to the favorites file (JSON, or binary for ".jbf")
         recent_filename (str): Path to the recent books JSON file
-        favorites (list): List of favorite book dictionaries
-        recent_books (list): List of recently viewed book dictionaries
+        favorites (list | BinaryFavoritesStore): Favorite book dictionaries
+        recent_books (RecentBooks): Recently viewed book dictionaries, most recent first
+        recent_save_every (int): Number of recent book changes batched into one save
+        recent_save_interval (float): Seconds after which pending recent changes are saved
+        index (FavoritesIndex): Sort and facet index, built on first use
+        favorite_keys (set): (title, authors) keys of all favorites, built on first use
     """
     
-    def __init__(self, filename='favorites/favorites.json', recent_filename='favorites/recent.json'):
+    def __init__(self, filename='favorites/favorites.json', recent_filename='favorites/recent.json',
+                 recent_capacity=100, recent_save_every=20, recent_save_interval=30.0):
         """Initialize the FavoritesManager with file paths and load existing data.
         
         Args:
             filename (str, optional): Path to favorites file. Defaults to 'favorites/favorites.json'.
             recent_filename (str, optional): Path to recent books file. Defaults to 'favorites/recent.json'.
+            recent_capacity (int, optional): Number of recent books kept. Defaults to 100.
+            recent_save_every (int, optional): Recent book changes per save. Defaults to 20.
+            recent_save_interval (float, optional): Max seconds before pending recent changes are saved. Defaults to 30.0.
         """
         self.filename = filename
         self.recent_filename = recent_filename
+        self.recent_save_every = recent_save_every
+        self.recent_save_interval = recent_save_interval
         self.favorites = self.load_favorites()
-        self.recent_books = self.load_recent_books()
+        self.index = None
+        self.favorite_keys = None
+        self.recent_books = RecentBooks(recent_capacity, self.load_recent_books())
+        self.recent_pending = 0
+        self.recent_saved_at = time.monotonic()
+        # Recent books are saved in batches, so write out whatever is left on exit
+        atexit.register(self.flush)
 
     def load_favorites(self):
-        """Load favorite books from the JSON file.
+        """Load favorite books from the favorites file.
+        
+        Binary stores are memory-mapped and decoded lazily, so only the header
+        is read here.
         
         Returns:
-            list: List of favorite book dictionaries
+            list | BinaryFavoritesStore: Favorite book dictionaries
         """
+        if is_binary_store(self.filename):
+            if os.path.exists(self.filename):
+                try:
+                    return BinaryFavoritesStore(self.filename)
+                except ValueError:
+                    return []
+            return []
         if os.path.exists(self.filename):
             try:
                 with open(self.filename, 'r') as f:
@@ -67,15 +116,46 @@ class FavoritesManager:
         return []
 
     def save_favorites(self):
-        """Save favorite books to the JSON file."""
-        with open(self.filename, 'w') as f:
+        """Save favorite books to the favorites file.
+        
+        Both formats rewrite the whole file, so a save costs O(n) in the
+        number of favorites.
+        """
+        if is_binary_store(self.filename):
+            with metrics.timer('favorites_save_duration_seconds', store='favorites'):
+                write_store(self.filename, self.favorites)
+            return
+        with metrics.timer('favorites_save_duration_seconds', store='favorites'), open(self.filename, 'w') as f:
             json.dump(self.favorites, f, indent=2)
 
+    def editable_favorites(self):
+        """Get favorites as a mutable list, decoding a binary store if needed.
+        
+        Decoding a binary store touches every record, so this is only used for
+        changes other than adding a favorite.
+        
+        Returns:
+            list: List of favorite book dictionaries
+        """
+        if isinstance(self.favorites, BinaryFavoritesStore):
+            store = self.favorites
+            self.favorites = list(store)
+            store.close()
+        return self.favorites
+
     def save_recent_books(self):
         """Save recently viewed books to the JSON file."""
-        with open(self.recent_filename, 'w') as f:
-            json.dump(self.recent_books, f, indent=2)
+        with metrics.timer('favorites_save_duration_seconds', store='recent'), open(self.recent_filename, 'w') as f:
+            json.dump(self.recent_books.to_list(), f, indent=2)
+        self.recent_pending = 0
+        self.recent_saved_at = time.monotonic()
 
+    def flush(self):
+        """Save recently viewed books if there are unsaved changes."""
+        if self.recent_pending:
+            self.save_recent_books()
+
+    @traced('FavoritesManager.add_favorite')
     def add_favorite(self, book, note=None):
         """Add a book to favorites with an optional note.
         
@@ -88,34 +168,148 @@ class FavoritesManager:
         """
         book_data = book.to_dict()
         book_data['note'] = note
-        if book_data not in self.favorites:
+        if self.is_favorite(book_data):
+            return False
+        book_data['added_at'] = datetime.now().isoformat(timespec='seconds')
+        if isinstance(self.favorites, BinaryFavoritesStore):
+            # Existing records are copied as raw bytes rather than decoded
+            with metrics.timer('favorites_save_duration_seconds', store='favorites'):
+                append_records(self.favorites, [book_data])
+            self.favorites = BinaryFavoritesStore(self.filename)
+        else:
             self.favorites.append(book_data)
             self.save_favorites()
-            return True
-        return False
+        if self.index is not None:
+            self.index.add(book_data)
+        self.favorite_keys.add(favorite_key(book_data['title'], book_data['authors']))
+        return True
+
+    def is_favorite(self, book_data):
+        """Check whether a book with the same fields is already in favorites.
+        
+        Candidates are looked up by title and authors, so full records are
+        only compared (and, for a binary store, decoded) when those match.
+        
+        Args:
+            book_data (dict): Book dictionary including its note
+            
+        Returns:
+            bool: True if the book is already in favorites
+        """
+        key = favorite_key(book_data['title'], book_data['authors'])
+        if self.favorite_keys is None:
+            self.favorite_keys = {favorite_key(title, authors) for title, authors in self.titles_and_authors()}
+        if key not in self.favorite_keys:
+            return False
+        candidates = (self.favorites[i] for i, (title, authors) in enumerate(self.titles_and_authors())
+                      if favorite_key(title, authors) == key)
+        return any(all(f.get(k) == book_data[k] for k in BOOK_FIELDS) for f in candidates)
 
+    def titles_and_authors(self):
+        """Iterate over the title and authors of every favorite without decoding whole records.
+        
+        Yields:
+            tuple: (title, list of authors)
+        """
+        if isinstance(self.favorites, BinaryFavoritesStore):
+            for i in range(len(self.favorites)):
+                yield self.favorites.title_and_authors(i)
+        else:
+            for book_data in self.favorites:
+                yield book_data.get('title'), book_data.get('authors')
+
+    @traced('FavoritesManager.add_recent')
     def add_recent(self, book):
         """Add a book to recently viewed list.
         
+        A book viewed again is moved to the front instead of being duplicated.
+        Changes are saved in batches of `recent_save_every`, after
+        `recent_save_interval` seconds, or by `flush`, rather than on every view.
+        
         Args:
             book (Book): Book object to add
         """
-        book_data = book.to_dict()
-        if book_data not in self.recent_books:
-            self.recent_books.insert(0, book_data)
-            if len(self.recent_books) > 10:
-                self.recent_books.pop()
+        if not self.recent_books.add(book.to_dict()):
+            return
+        self.recent_pending += 1
+        if (self.recent_pending >= self.recent_save_every
+                or time.monotonic() - self.recent_saved_at >= self.recent_save_interval):
             self.save_recent_books()
 
+    @traced('FavoritesManager.remove_favorite')
     def remove_favorite(self, book_title):
         """Remove a book from favorites by title.
         
         Args:
             book_title (str): Title of the book to remove
         """
-        self.favorites = [f for f in self.favorites if f['title'] != book_title]
+        self.favorites = [f for f in self.editable_favorites() if f['title'] != book_title]
+        self.favorite_keys = None
+        if self.index is not None:
+            self.index.remove_title(book_title)
         self.save_favorites()
 
+    @traced('FavoritesManager.dedupe_favorites')
+    def dedupe_favorites(self, dry_run=False, workers=None):
+        """Merge near-duplicate favorites (e.g. other editions of the same work).
+        
+        Each group of duplicates is replaced by its most complete record, with
+        missing fields filled in from the others and their notes combined.
+        
+        Args:
+            dry_run (bool, optional): Only report duplicates without changing favorites. Defaults to False.
+            workers (int, optional): Worker processes used for large collections
+            
+        Returns:
+            MergeReport: Report of the merged duplicate groups
+        """
+        merged, report = deduplicate(self.favorites, workers=workers)
+        if report.groups and not dry_run:
+            self.editable_favorites()
+            self.favorites = merged
+            self.index = None
+            self.favorite_keys = None
+            self.save_favorites()
+        return report
+
+    def get_index(self):
+        """Get the sort and facet index, building it on first use.
+        
+        Returns:
+            FavoritesIndex: Index over the current favorites
+        """
+        if self.index is None:
+            self.index = FavoritesIndex(self.favorites)
+        return self.index
+
+    def favorites_page(self, sort='title', descending=False, page=0, page_size=10, facet=None, value=None):
+        """Get one page of favorites in a sort order, optionally within a facet value.
+        
+        Args:
+            sort (str, optional): Sort order (title/author/year/added). Defaults to 'title'.
+            descending (bool, optional): Reverse the sort order. Defaults to False.
+            page (int, optional): Zero-based page number. Defaults to 0.
+            page_size (int, optional): Books per page. Defaults to 10.
+            facet (str, optional): Facet to restrict to (author/year/language)
+            value (str, optional): Facet value to restrict to
+            
+        Returns:
+            tuple: (list[Book] on the page, total number of books in the view)
+        """
+        records, total = self.get_index().page(sort, descending, page, page_size, facet, value)
+        return [Book.from_dict(book_data) for book_data in records], total
+
+    def facet_counts(self, facet):
+        """Get the number of favorites for each value of a facet.
+        
+        Args:
+            facet (str): Facet name (author/year/language)
+            
+        Returns:
+            list[tuple[str, int]]: (value, count) pairs, most common first
+        """
+        return self.get_index().facet_counts(facet)
+
     def get_favorites(self):
         """Get all favorite books as Book objects.
         
@@ -132,6 +326,7 @@ class FavoritesManager:
         """
         return [Book.from_dict(book_data) for book_data in self.recent_books]
 
+    @traced('FavoritesManager.filter_favorites')
     def filter_favorites(self, author=None, title=None):
         """Filter favorite books by author and/or title.
         
@@ -142,6 +337,19 @@ class FavoritesManager:
         Returns:
             list[Book]: List of filtered Book objects
         """
+        if isinstance(self.favorites, BinaryFavoritesStore) and (author or title):
+            # Only decode the fields needed for matching, then the matching records
+            store = self.favorites
+            matches = []
+            for i in range(len(store)):
+                book_title, book_authors = store.title_and_authors(i)
+                if author and author.lower() not in ' '.join(book_authors).lower():
+                    continue
+                if title and title.lower() not in (book_title or '').lower():
+                    continue
+                matches.append(store[i])
+            return [Book.from_dict(book_data) for book_data in matches]
+
         filtered = self.favorites
         if author:
             filtered = [f for f in filtered if author.lower() in ' '.join(f['authors']).lower()]
@@ -149,6 +357,7 @@ class FavoritesManager:
             filtered = [f for f in filtered if title.lower() in f['title'].lower()]
         return [Book.from_dict(book_data) for book_data in filtered]
 
+    @traced('FavoritesManager.export_favorites')
     def export_favorites(self, format_type='csv', filename=None):
         """Export favorite books to a file in the specified format.
         
@@ -162,9 +371,10 @@ class FavoritesManager:
         if not filename:
             filename = f'exports/favorites_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{format_type}'
         
+        start = time.perf_counter()
         if format_type == 'csv':
             with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['title', 'authors', 'description', 'published_date', 'info_link', 'note'])
+                writer = csv.DictWriter(f, fieldnames=['title', 'authors', 'description', 'published_date', 'info_link', 'note', 'language', 'added_at'])
                 writer.writeheader()
                 for book in self.favorites:
                     row = book.copy()
@@ -172,7 +382,7 @@ class FavoritesManager:
                     writer.writerow(row)
         elif format_type == 'json':
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.favorites, f, indent=2, ensure_ascii=False)
+                json.dump(list(self.favorites), f, indent=2, ensure_ascii=False)
         elif format_type == 'md':
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write('# Favorite Books\n\n')
@@ -185,4 +395,21 @@ class FavoritesManager:
                     if book.get('description'):
                         f.write(f"### Description\n{book['description']}\n\n")
                     f.write("---\n\n")
-        return filename 
\ No newline at end of file
+        self.record_export_metrics(format_type, filename, time.perf_counter() - start)
+        return filename
+
+    def record_export_metrics(self, format_type, filename, duration):
+        """Record duration and throughput metrics for a finished export.
+
+        Args:
+            format_type (str): Export format (csv/json/md)
+            filename (str): Path to the exported file
+            duration (float): Export duration in seconds
+        """
+        metrics.observe('favorites_export_duration_seconds', duration, format=format_type)
+        metrics.inc('favorites_exported_books_total', len(self.favorites), format=format_type)
+        if os.path.exists(filename):
+            metrics.inc('favorites_exported_bytes_total', os.path.getsize(filename), format=format_type)
+        if duration > 0:
+            metrics.observe('favorites_export_books_per_second', len(self.favorites) / duration,
+                            buckets=THROUGHPUT_BUCKETS, format=format_type) 
\ No newline at end of file
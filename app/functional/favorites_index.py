@@ -0,0 +1,171 @@
+"""
+FavoritesIndex module for sorted, faceted and paged access to favorites.
+
+This module keeps favorites in precomputed sorted orders (title, author,
+published year and date added) for the whole collection and for every facet
+value (author, year, language). Adding or removing a favorite updates these
+orders incrementally, so fetching any page of any view, and any facet count,
+does not require scanning or re-sorting the collection.
+"""
+
+from bisect import bisect_left, insort
+
+UNKNOWN = 'Unknown'
+
+
+def _year(book_data):
+    """Get the publication year of a book, or UNKNOWN."""
+    year = (book_data.get('published_date') or '')[:4]
+    return year if year.isdigit() else UNKNOWN
+
+
+# Sort key functions for each supported sort order
+SORT_KEYS = {
+    'title': lambda d: (d.get('title') or '').lower(),
+    'author': lambda d: (d.get('authors') or [''])[0].lower(),
+    'year': lambda d: d.get('published_date') or '',
+    'added': lambda d: d.get('added_at') or '',
+}
+
+# Functions returning the facet values a book belongs to
+FACETS = {
+    'author': lambda d: d.get('authors') or [UNKNOWN],
+    'year': lambda d: [_year(d)],
+    'language': lambda d: [d.get('language') or UNKNOWN],
+}
+
+_ALL = ('all', None)
+
+
+class FavoritesIndex:
+    """Incrementally maintained sort orders and facet counts over favorite books.
+
+    Each group (the whole collection, or one facet value) holds one sorted
+    list of (sort key, record id) per sort order. Records get ids in the order
+    they are added, which also breaks ties between equal sort keys.
+    """
+
+    def __init__(self, records=()):
+        """Build the index for existing favorites.
+
+        Args:
+            records (Iterable[dict]): Favorite book dictionaries, in stored order
+        """
+        self._records = {}
+        self._groups = {}
+        self._by_title = {}
+        self._next_id = 0
+        for book_data in records:
+            self._insert(book_data, sort=False)
+        for orders in self._groups.values():
+            for order in orders.values():
+                order.sort()
+
+    def __len__(self):
+        """Get the number of indexed favorites."""
+        return len(self._records)
+
+    def add(self, book_data):
+        """Add a favorite to all sort orders and facets.
+
+        Args:
+            book_data (dict): Favorite book dictionary
+
+        Returns:
+            int: Id of the new record
+        """
+        return self._insert(book_data, sort=True)
+
+    def remove(self, record_id):
+        """Remove a favorite from all sort orders and facets.
+
+        Args:
+            record_id (int): Id of the record to remove
+        """
+        book_data = self._records.pop(record_id)
+        for group in self._memberships(book_data):
+            orders = self._groups[group]
+            for name, order in orders.items():
+                entry = (SORT_KEYS[name](book_data), record_id)
+                del order[bisect_left(order, entry)]
+            if not orders['title']:
+                del self._groups[group]
+        ids = self._by_title[book_data.get('title')]
+        ids.discard(record_id)
+        if not ids:
+            del self._by_title[book_data.get('title')]
+
+    def remove_title(self, title):
+        """Remove all favorites with a given title.
+
+        Args:
+            title (str): Title of the books to remove
+
+        Returns:
+            int: Number of removed records
+        """
+        ids = list(self._by_title.get(title, ()))
+        for record_id in ids:
+            self.remove(record_id)
+        return len(ids)
+
+    def page(self, sort='title', descending=False, page=0, page_size=10, facet=None, value=None):
+        """Get one page of favorites in a sort order, optionally within a facet value.
+
+        Args:
+            sort (str, optional): Sort order (title/author/year/added). Defaults to 'title'.
+            descending (bool, optional): Reverse the sort order. Defaults to False.
+            page (int, optional): Zero-based page number. Defaults to 0.
+            page_size (int, optional): Books per page. Defaults to 10.
+            facet (str, optional): Facet to restrict to (author/year/language)
+            value (str, optional): Facet value to restrict to
+
+        Returns:
+            tuple: (list of book dictionaries on the page, total number of books in the view)
+        """
+        orders = self._groups.get((facet, value) if facet else _ALL)
+        if not orders:
+            return [], 0
+        order = orders[sort]
+        total = len(order)
+        start = page * page_size
+        if descending:
+            entries = order[max(total - start - page_size, 0):max(total - start, 0)][::-1]
+        else:
+            entries = order[start:start + page_size]
+        return [self._records[record_id] for _, record_id in entries], total
+
+    def facet_counts(self, facet):
+        """Get the number of favorites for each value of a facet.
+
+        Args:
+            facet (str): Facet name (author/year/language)
+
+        Returns:
+            list[tuple[str, int]]: (value, count) pairs, most common first
+        """
+        counts = [(value, len(orders['title'])) for (name, value), orders in self._groups.items() if name == facet]
+        return sorted(counts, key=lambda item: (-item[1], item[0]))
+
+    def _memberships(self, book_data):
+        """Get the groups a record belongs to."""
+        groups = {_ALL}
+        for facet, values in FACETS.items():
+            groups.update((facet, value) for value in values(book_data))
+        return groups
+
+    def _insert(self, book_data, sort):
+        """Add a record, inserting into sorted position or appending for a later bulk sort."""
+        record_id = self._next_id
+        self._next_id += 1
+        self._records[record_id] = book_data
+        self._by_title.setdefault(book_data.get('title'), set()).add(record_id)
+        for group in self._memberships(book_data):
+            orders = self._groups.setdefault(group, {name: [] for name in SORT_KEYS})
+            for name, order in orders.items():
+                entry = (SORT_KEYS[name](book_data), record_id)
+                if sort:
+                    insort(order, entry)
+                else:
+                    order.append(entry)
+        return record_id
@@ -0,0 +1,350 @@
+"""
+HTTP record-and-replay module for exercising the networking path offline.
+
+This module captures real Google Books API responses into a cassette directory
+and plays them back, either in-process through a `requests` transport adapter
+or over HTTP from a local stub server. The stub server can add latency, random
+errors and rate limiting, so pooling, retries, concurrency and caching of the
+finder can be benchmarked deterministically on machines without network access.
+
+Responses are keyed by URL path and query parameters (not host), so cassettes
+recorded against the live API can be served from any address.
+
+Usage:
+    python main.py --record cassettes --title "Dune"      # record live responses
+    python main.py --replay cassettes --title "Dune"      # replay in-process
+    python -m app.functional.http_replay serve --cassettes cassettes --latency 0.2 --error-rate 0.1 --rate 5
+    python main.py --api-url http://127.0.0.1:8765/books/v1/volumes --title "Dune"
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from app.functional.logging_config import get_logger
+
+# Headers that no longer describe the stored (already decoded) body
+_DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+def request_key(url):
+    """Get the cassette key for a request URL.
+
+    Args:
+        url (str): Full request URL, or path with query string
+
+    Returns:
+        str: Hex digest identifying the request path and sorted query parameters
+    """
+    parts = urlsplit(url)
+    params = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    return hashlib.sha1(json.dumps([parts.path, params]).encode('utf-8')).hexdigest()
+
+
+class Cassette:
+    """A directory of recorded HTTP responses, one JSON file per request.
+
+    Attributes:
+        directory (str): Path to the cassette directory
+    """
+
+    def __init__(self, directory):
+        """Initialize the cassette, creating its directory if needed.
+
+        Args:
+            directory (str): Path to the cassette directory
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, url):
+        """Get the file path storing the response for a URL.
+
+        Args:
+            url (str): Request URL
+
+        Returns:
+            str: Path to the JSON file
+        """
+        return os.path.join(self.directory, f'{request_key(url)}.json')
+
+    def save(self, url, status, headers, body):
+        """Store a response.
+
+        Args:
+            url (str): Request URL
+            status (int): HTTP status code
+            headers (dict): Response headers
+            body (bytes): Response body
+        """
+        entry = {
+            'url': url,
+            'status': status,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS},
+            'body': body.decode('utf-8'),
+        }
+        with open(self.path(url), 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2, ensure_ascii=False)
+
+    def load(self, url):
+        """Load the stored response for a URL.
+
+        Args:
+            url (str): Request URL
+
+        Returns:
+            dict: Stored entry with status, headers and body, or None if not recorded
+        """
+        path = self.path(url)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that sends real requests and records successful responses."""
+
+    def __init__(self, cassette, **kwargs):
+        """Initialize the recording adapter.
+
+        Args:
+            cassette (Cassette): Cassette to record into
+            **kwargs: Passed on to HTTPAdapter
+        """
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        """Send a request and record its response if it succeeded.
+
+        Args:
+            request (PreparedRequest): The request to send
+            **kwargs: Passed on to HTTPAdapter.send
+
+        Returns:
+            Response: The live response
+        """
+        response = super().send(request, **kwargs)
+        if response.status_code < 400:
+            self.cassette.save(request.url, response.status_code, response.headers, response.content)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter that answers requests from a cassette without using the network."""
+
+    def __init__(self, cassette):
+        """Initialize the replay adapter.
+
+        Args:
+            cassette (Cassette): Cassette to replay from
+        """
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        """Build a response for a request from the cassette.
+
+        Args:
+            request (PreparedRequest): The request to answer
+            **kwargs: Ignored transport options
+
+        Returns:
+            Response: The recorded response
+
+        Raises:
+            requests.exceptions.ConnectionError: If the request was never recorded
+        """
+        entry = self.cassette.load(request.url)
+        if entry is None:
+            raise requests.exceptions.ConnectionError(f"No recorded response for {request.url}", request=request)
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(0)
+        return response
+
+    def close(self):
+        """Nothing to clean up."""
+
+
+def use_cassette(finder, directory, mode='replay'):
+    """Route a finder's HTTP session through a cassette.
+
+    Args:
+        finder (GoogleBooksFinder): Finder whose session is patched
+        directory (str): Path to the cassette directory
+        mode (str, optional): "record" or "replay". Defaults to 'replay'.
+
+    Returns:
+        Cassette: The cassette in use
+    """
+    cassette = Cassette(directory)
+    adapter = RecordingAdapter(cassette) if mode == 'record' else ReplayAdapter(cassette)
+    finder.session.mount('http://', adapter)
+    finder.session.mount('https://', adapter)
+    return cassette
+
+
+class StubServer:
+    """Local HTTP server that serves recorded responses with simulated network conditions.
+
+    Attributes:
+        cassette (Cassette): Cassette responses are served from
+        latency (float): Seconds added to every response
+        jitter (float): Maximum random seconds added on top of `latency`
+        error_rate (float): Fraction of requests answered with 503
+        rate_limit (float): Requests per second allowed before answering 429, or None
+        url (str): Base URL of the running server
+    """
+
+    def __init__(self, cassette, host='127.0.0.1', port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, rate_limit=None, burst=None, seed=None):
+        """Initialize the stub server.
+
+        Args:
+            cassette (Cassette): Cassette responses are served from
+            host (str, optional): Address to bind. Defaults to '127.0.0.1'.
+            port (int, optional): Port to bind, 0 for any free port. Defaults to 0.
+            latency (float, optional): Seconds added to every response. Defaults to 0.0.
+            jitter (float, optional): Maximum random extra seconds. Defaults to 0.0.
+            error_rate (float, optional): Fraction of requests failing with 503. Defaults to 0.0.
+            rate_limit (float, optional): Allowed requests per second, None for unlimited
+            burst (int, optional): Requests allowed at once. Defaults to the rate limit.
+            seed (int, optional): Random seed for reproducible jitter and errors
+        """
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.burst = burst or max(1, int(rate_limit or 1))
+        self.logger = get_logger('stub_server')
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+        self.url = f'http://{host}:{self._server.server_address[1]}'
+
+    def start(self):
+        """Start serving in a background thread.
+
+        Returns:
+            str: Base URL of the server
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, name='stub-server', daemon=True)
+        self._thread.start()
+        return self.url
+
+    def serve_forever(self):
+        """Serve requests in the current thread until interrupted."""
+        self._server.serve_forever()
+
+    def stop(self):
+        """Stop the server and release its port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _take_token(self):
+        """Take a request token from the rate limiter, returning False when throttled."""
+        if self.rate_limit is None:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate_limit)
+            self._refilled_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _plan(self):
+        """Decide the delay and whether to fail for the next request."""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self._random.random() < self.error_rate
+        return delay, fail
+
+    def _handler_class(self):
+        """Build the request handler class bound to this server."""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                """Answer a GET request from the cassette, applying throttling, latency and errors."""
+                if not stub._take_token():
+                    self._reply(429, {'error': {'code': 429, 'message': 'Rate limit exceeded'}}, {'Retry-After': '1'})
+                    return
+                delay, fail = stub._plan()
+                if delay:
+                    time.sleep(delay)
+                if fail:
+                    self._reply(503, {'error': {'code': 503, 'message': 'Simulated backend error'}})
+                    return
+                entry = stub.cassette.load(self.path)
+                if entry is None:
+                    self._reply(404, {'error': {'code': 404, 'message': f'No recorded response for {self.path}'}})
+                    return
+                self._reply(entry['status'], entry['body'], entry['headers'])
+
+            def _reply(self, status, body, headers=None):
+                """Send a response with the given status, body and headers."""
+                data = (body if isinstance(body, str) else json.dumps(body)).encode('utf-8')
+                self.send_response(status)
+                for name, value in (headers or {'Content-Type': 'application/json; charset=UTF-8'}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                """Route access logs to the application logger instead of stderr."""
+                stub.logger.debug(format % args)
+
+        return Handler
+
+
+def main():
+    """Command-line entry point for running the stub server."""
+    parser = argparse.ArgumentParser(description="Serve recorded Google Books responses locally")
+    parser.add_argument("command", choices=["serve"], help="Command to run")
+    parser.add_argument("--cassettes", default="cassettes", help="Cassette directory")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random extra seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 503")
+    parser.add_argument("--rate", type=float, help="Allowed requests per second (429 above)")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible runs")
+    args = parser.parse_args()
+
+    server = StubServer(Cassette(args.cassettes), args.host, args.port, args.latency, args.jitter,
+                        args.error_rate, args.rate, seed=args.seed)
+    print(f"Serving {args.cassettes} at {server.url}/books/v1/volumes")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
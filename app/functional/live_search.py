@@ -0,0 +1,188 @@
+"""
+Live search module for incremental search-as-you-type.
+
+This module provides the IncrementalSearch class which turns a stream of
+partial queries (one per keystroke) into a small number of book searches.
+Requests are debounced, superseded requests are cancelled or ignored, and
+results already fetched are filtered locally so something useful can be
+shown while a request is still pending.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from app.functional.logging_config import get_logger
+from app.functional.metrics import metrics
+from app.functional.prefetch import PAGE_SIZE
+
+
+def matches_text(book, text):
+    """Check whether every word of a query appears in a book's title, authors or description.
+
+    Args:
+        book (Book): The book to check
+        text (str): The partial query
+
+    Returns:
+        bool: True if all query words are found
+    """
+    haystack = ' '.join([book.title or '', ' '.join(book.authors or []), book.description or '']).lower()
+    return all(word in haystack for word in text.lower().split())
+
+
+class IncrementalSearch:
+    """Debounced, cancellable search driven by a query that changes as the user types.
+
+    Call `update` on every keystroke and `snapshot` to get what should be shown.
+    Only the latest query is ever sent once typing pauses for `debounce` seconds;
+    results of older queries that finish late are discarded.
+
+    Attributes:
+        book_finder (BookFinderBase): The book finder used for searches
+        lang (str): Language to filter by
+        debounce (float): Seconds of inactivity before a query is sent
+        min_chars (int): Minimum query length that triggers a request
+    """
+
+    def __init__(self, book_finder, lang=None, debounce=0.3, min_chars=2, max_workers=2):
+        """Initialize the incremental search.
+
+        Args:
+            book_finder (BookFinderBase): The book finder used for searches
+            lang (str, optional): Language to filter by
+            debounce (float, optional): Seconds to wait after the last keystroke. Defaults to 0.3.
+            min_chars (int, optional): Minimum query length to search for. Defaults to 2.
+            max_workers (int, optional): Number of background threads. Defaults to 2.
+        """
+        self.book_finder = book_finder
+        self.lang = lang
+        self.debounce = debounce
+        self.min_chars = min_chars
+        self.logger = get_logger('live_search')
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='live-search')
+        self._lock = threading.Lock()
+        self._timer = None
+        self._future = None
+        self._generation = 0
+        self._text = ''
+        self._results = {}
+        self._shown = []
+        self._shown_query = ''
+        self._pending = False
+        self._version = 0
+
+    def update(self, text):
+        """Register a new version of the query text.
+
+        Cached results are used immediately when available; otherwise local
+        results are filtered right away and a request is scheduled once the
+        debounce delay passes without further changes.
+
+        Args:
+            text (str): The current query text
+        """
+        text = text.strip()
+        with self._lock:
+            if text == self._text:
+                return
+            self._text = text
+            self._generation += 1
+            generation = self._generation
+            self._cancel_pending()
+
+            if text in self._results:
+                metrics.inc('cache_hits_total', cache='live_search')
+                self._show(text, self._results[text], pending=False)
+                return
+            self._show(text, self.filter_local(text), pending=len(text) >= self.min_chars)
+            if len(text) < self.min_chars:
+                return
+
+            self._timer = threading.Timer(self.debounce, self._send, args=(text, generation))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def filter_local(self, text):
+        """Filter already-fetched results for a query while its request is pending.
+
+        Results of the longest cached query that is a prefix of `text` are
+        preferred; other fetched results are used after them.
+
+        Args:
+            text (str): The current query text
+
+        Returns:
+            list[Book]: Locally matching books, best candidates first
+        """
+        if not text:
+            return []
+        prefixes = sorted((q for q in self._results if text.startswith(q)), key=len, reverse=True)
+        others = [q for q in self._results if q not in prefixes]
+        seen = set()
+        found = []
+        for q in prefixes + others:
+            for book in self._results[q]:
+                key = (book.title, book.info_link)
+                if key not in seen and matches_text(book, text):
+                    seen.add(key)
+                    found.append(book)
+        return found[:PAGE_SIZE]
+
+    def snapshot(self):
+        """Get the results that should currently be displayed.
+
+        Returns:
+            tuple: (version, query the results belong to, list[Book], whether a request is pending)
+        """
+        with self._lock:
+            return self._version, self._shown_query, list(self._shown), self._pending
+
+    def close(self):
+        """Cancel pending requests and stop the background threads."""
+        with self._lock:
+            self._generation += 1
+            self._cancel_pending()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _show(self, text, books, pending):
+        """Replace the displayed results. Must be called with the lock held."""
+        self._shown_query = text
+        self._shown = books
+        self._pending = pending
+        self._version += 1
+
+    def _cancel_pending(self):
+        """Cancel the scheduled and queued requests. Must be called with the lock held."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._future is not None:
+            if self._future.cancel():
+                metrics.inc('live_search_cancelled_total')
+            self._future = None
+
+    def _send(self, text, generation):
+        """Submit the request for a query once its debounce delay has passed."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            metrics.inc('cache_misses_total', cache='live_search')
+            self._future = self._executor.submit(self._search, text, generation)
+
+    def _search(self, text, generation):
+        """Run a search and publish its results unless the query has changed meanwhile."""
+        start = time.perf_counter()
+        try:
+            books = self.book_finder.search_books(text, lang=self.lang, max_results=PAGE_SIZE)
+        except Exception as e:
+            self.logger.error(f"Live search for '{text}' failed: {str(e)}")
+            books = None
+        metrics.observe('live_search_duration_seconds', time.perf_counter() - start)
+
+        with self._lock:
+            if books is not None:
+                self._results[text] = books
+            if generation != self._generation:
+                metrics.inc('live_search_superseded_total')
+                return
+            self._show(text, books or [], pending=False)
@@ -0,0 +1,343 @@
+"""
+Logging configuration module for the book finder application.
+
+This module routes all application logging through a queue so that log records
+are formatted and written by a background thread instead of on the request path.
+Records are written as JSON lines to a rotating log file, with per-component
+levels and optional sampling of low-severity records for high-volume runs.
+
+Settings can be overridden through environment variables:
+    BOOK_FINDER_LOG_FILE: Path to the log file (default: book_finder.log)
+    BOOK_FINDER_LOG_LEVEL: Base level for all components (default: INFO)
+    BOOK_FINDER_LOG_LEVELS: Per-component levels, e.g. "google=DEBUG,favorites=WARNING"
+    BOOK_FINDER_LOG_ROTATION: "size" or "time" (default: size)
+    BOOK_FINDER_LOG_SAMPLE_RATE: Fraction of DEBUG/INFO records to keep (default: 1.0)
+    BOOK_FINDER_LOG_CONSOLE: Console level, or "off" to disable (default: WARNING)
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# Parent logger for all application components (e.g. "book_finder.google")
+ROOT_LOGGER = 'book_finder'
+
+_listener = None
+
+
+def get_logger(component):
+    """Get the logger for an application component.
+
+    Args:
+        component (str): Component name (e.g. 'finder', 'google', 'favorites')
+
+    Returns:
+        Logger: Logger named "book_finder.<component>"
+    """
+    return logging.getLogger(f'{ROOT_LOGGER}.{component}')
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter that renders each log record as a single JSON object."""
+
+    def format(self, record):
+        """Format a log record as a JSON line.
+
+        Args:
+            record (LogRecord): The record to format
+
+        Returns:
+            str: The JSON-encoded record
+        """
+        data = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """Filter that keeps only a fraction of low-severity records.
+
+    Records at or above `min_level` always pass, so warnings and errors are
+    never dropped by sampling.
+
+    Attributes:
+        rate (float): Fraction of low-severity records to keep (0.0-1.0)
+        min_level (int): Level from which records are always kept
+    """
+
+    def __init__(self, rate=1.0, min_level=logging.WARNING):
+        """Initialize the sampling filter.
+
+        Args:
+            rate (float, optional): Fraction of records to keep. Defaults to 1.0.
+            min_level (int, optional): Level always kept. Defaults to WARNING.
+        """
+        super().__init__()
+        self.rate = rate
+        self.min_level = min_level
+
+    def filter(self, record):
+        """Decide whether a record should be logged.
+
+        Args:
+            record (LogRecord): The record to check
+
+        Returns:
+            bool: True if the record should be logged
+        """
+        if record.levelno >= self.min_level or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+class ConsoleGate(logging.Filter):
+    """Filter that holds back console records while a live screen owns the terminal.
+
+    Records arriving while the gate is closed are kept and written once it
+    reopens, so they do not break into full-screen displays. The file log
+    is not affected.
+    """
+
+    def __init__(self):
+        """Initialize an open gate."""
+        super().__init__()
+        self._lock = threading.Lock()
+        self._held = None
+
+    def filter(self, record):
+        """Decide whether a record is written now or held back.
+
+        Args:
+            record (LogRecord): The record to check
+
+        Returns:
+            bool: True if the record should be written now
+        """
+        with self._lock:
+            if self._held is None:
+                return True
+            self._held.append(record)
+            return False
+
+    def close(self):
+        """Start holding back records."""
+        with self._lock:
+            if self._held is None:
+                self._held = []
+
+    def open(self):
+        """Stop holding back records.
+
+        Returns:
+            list[LogRecord]: Records held back while the gate was closed
+        """
+        with self._lock:
+            held, self._held = self._held or [], None
+        return held
+
+
+_console_gate = ConsoleGate()
+
+
+@contextmanager
+def console_suspended():
+    """Hold back console log output for the duration of the block.
+
+    Use this around rich Live screens; warnings logged meanwhile are written
+    to the console after the screen closes.
+    """
+    _console_gate.close()
+    try:
+        yield
+    finally:
+        held = _console_gate.open()
+        handlers = _listener.handlers if _listener is not None else ()
+        for record in held:
+            for handler in handlers:
+                if _console_gate in handler.filters and record.levelno >= handler.level:
+                    handler.handle(record)
+
+
+def parse_component_levels(spec):
+    """Parse a per-component level specification.
+
+    Args:
+        spec (str): Comma-separated "component=LEVEL" pairs
+
+    Returns:
+        dict: Mapping of component names to level names
+    """
+    levels = {}
+    for part in (spec or '').split(','):
+        if '=' in part:
+            component, level = part.split('=', 1)
+            levels[component.strip()] = level.strip().upper()
+    return levels
+
+
+def check_level(level, default, setting):
+    """Validate a level name, falling back to a default.
+
+    Args:
+        level (str): Level name to check (e.g. 'debug')
+        default (str): Level name used when `level` is not a known level, or None to ignore it
+        setting (str): Name of the setting, used in the warning message
+
+    Returns:
+        tuple: (upper-case level name, warning message or None)
+    """
+    name = str(level).strip().upper()
+    if isinstance(logging.getLevelName(name), int):
+        return name, None
+    fallback = f"using {default}" if default else "ignoring it"
+    return default, f"Unknown log level {level!r} for {setting}, {fallback}"
+
+
+def check_sample_rate(rate):
+    """Validate a sampling rate, falling back to keeping all records.
+
+    Args:
+        rate (float | str): Fraction of DEBUG/INFO records to keep
+
+    Returns:
+        tuple: (rate between 0.0 and 1.0, warning message or None)
+    """
+    try:
+        value = float(rate)
+    except (TypeError, ValueError):
+        return 1.0, f"Invalid log sample rate {rate!r}, using 1.0"
+    if not 0.0 <= value <= 1.0:
+        return 1.0, f"Log sample rate {rate!r} is not between 0 and 1, using 1.0"
+    return value, None
+
+
+def create_file_handler(log_file, rotation='size', max_bytes=5 * 1024 * 1024, backup_count=3):
+    """Create a rotating file handler for the log file.
+
+    Args:
+        log_file (str): Path to the log file
+        rotation (str, optional): "size" or "time" based rotation. Defaults to 'size'.
+        max_bytes (int, optional): File size that triggers size rotation. Defaults to 5 MB.
+        backup_count (int, optional): Number of rotated files to keep. Defaults to 3.
+
+    Returns:
+        Handler: The configured file handler
+    """
+    if rotation == 'time':
+        handler = logging.handlers.TimedRotatingFileHandler(
+            log_file, when='midnight', backupCount=backup_count, encoding='utf-8'
+        )
+    else:
+        handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+        )
+    handler.setFormatter(JsonFormatter())
+    return handler
+
+
+def setup_logging(log_file=None, level=None, component_levels=None, rotation=None,
+                  sample_rate=None, console_level=None):
+    """Configure queue-based background logging for the application.
+
+    Log calls only put records on an in-memory queue; a background listener
+    thread formats and writes them. Calling this more than once has no effect
+    until `shutdown_logging` is called. Arguments default to the environment
+    variables described in the module docstring.
+
+    Args:
+        log_file (str, optional): Path to the log file
+        level (str, optional): Base level for all components
+        component_levels (dict, optional): Mapping of component names to levels
+        rotation (str, optional): "size" or "time" based rotation
+        sample_rate (float, optional): Fraction of DEBUG/INFO records to keep
+        console_level (str, optional): Console level, or "off" to disable
+
+    Returns:
+        QueueListener: The running background listener
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_file = log_file or os.environ.get('BOOK_FINDER_LOG_FILE', 'book_finder.log')
+    level = level or os.environ.get('BOOK_FINDER_LOG_LEVEL', 'INFO')
+    if component_levels is None:
+        component_levels = parse_component_levels(os.environ.get('BOOK_FINDER_LOG_LEVELS'))
+    rotation = rotation or os.environ.get('BOOK_FINDER_LOG_ROTATION', 'size')
+    if sample_rate is None:
+        sample_rate = os.environ.get('BOOK_FINDER_LOG_SAMPLE_RATE', '1.0')
+    console_level = console_level or os.environ.get('BOOK_FINDER_LOG_CONSOLE', 'WARNING')
+
+    # Invalid settings fall back to defaults instead of breaking every finder
+    problems = []
+    level, problem = check_level(level, 'INFO', 'BOOK_FINDER_LOG_LEVEL')
+    problems.append(problem)
+    checked_levels = {}
+    for component, component_level in component_levels.items():
+        component_level, problem = check_level(component_level, None, f'component {component!r}')
+        if problem:
+            problems.append(problem)
+        else:
+            checked_levels[component] = component_level
+    component_levels = checked_levels
+    sample_rate, problem = check_sample_rate(sample_rate)
+    problems.append(problem)
+    if console_level.lower() != 'off':
+        console_level, problem = check_level(console_level, 'WARNING', 'BOOK_FINDER_LOG_CONSOLE')
+        problems.append(problem)
+
+    handlers = [create_file_handler(log_file, rotation)]
+    if console_level.lower() != 'off':
+        # Console output stays at warnings and above so it does not clutter the UI
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(console_level.upper())
+        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        console_handler.addFilter(_console_gate)
+        handlers.append(console_handler)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_rate))
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(level.upper())
+    root.addHandler(queue_handler)
+    root.propagate = False
+    for component, component_level in component_levels.items():
+        get_logger(component).setLevel(component_level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    for problem in filter(None, problems):
+        get_logger('logging').warning(problem)
+    return _listener
+
+
+def shutdown_logging():
+    """Flush pending records, stop the background listener and close handlers."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+    _listener = None
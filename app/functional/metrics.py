@@ -0,0 +1,357 @@
+"""
+Metrics module for collecting counters, latency histograms and trace spans.
+
+This module provides a small, dependency-free metrics registry used to find out
+where time goes when searching for books and managing favorites. Collected data
+can be exported as Prometheus text exposition format or as JSON.
+"""
+
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# Latency buckets in seconds, from sub-millisecond parsing up to slow API calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Throughput buckets in items per second, for bulk operations such as exports
+THROUGHPUT_BUCKETS = (10, 100, 1000, 5000, 10000, 50000, 100000, 500000, 1000000)
+
+
+def _label_key(labels):
+    """Convert a labels dict into a hashable, order-independent key."""
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key, extra=None):
+    """Format a label key as a Prometheus label set (e.g. '{method="GET"}')."""
+    pairs = list(key) + (extra or [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{v}"' for k, v in pairs) + '}'
+
+
+class Histogram:
+    """A cumulative histogram of observed values.
+
+    Attributes:
+        buckets (tuple[float]): Upper bounds of the histogram buckets
+        counts (list[int]): Number of observations falling in each bucket
+        count (int): Total number of observations
+        sum (float): Sum of all observed values
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """Initialize an empty histogram.
+
+        Args:
+            buckets (tuple[float], optional): Bucket upper bounds. Defaults to DEFAULT_BUCKETS.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Record a single observation.
+
+        Args:
+            value (float): The observed value
+        """
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        """Get cumulative bucket counts as used by Prometheus.
+
+        Returns:
+            list[tuple[float, int]]: (upper bound, cumulative count) pairs
+        """
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsRegistry:
+    """A thread-safe registry of counters, histograms and trace spans.
+
+    Tracing is optional and disabled by default; counters and histograms are
+    always collected since they are cheap to update.
+
+    Attributes:
+        tracing_enabled (bool): Whether spans are recorded
+        max_spans (int): Maximum number of finished spans kept in memory
+    """
+
+    def __init__(self, tracing_enabled=False, max_spans=1000):
+        """Initialize an empty registry.
+
+        Args:
+            tracing_enabled (bool, optional): Record trace spans. Defaults to False.
+            max_spans (int, optional): Finished spans to keep. Defaults to 1000.
+        """
+        self.tracing_enabled = tracing_enabled
+        self.max_spans = max_spans
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._counters = {}
+        self._histograms = {}
+        self._spans = []
+
+    def inc(self, name, value=1, **labels):
+        """Increment a counter.
+
+        Args:
+            name (str): Metric name
+            value (float, optional): Amount to add. Defaults to 1.
+            **labels: Label values identifying the time series
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name, value, buckets=DEFAULT_BUCKETS, **labels):
+        """Record an observation in a histogram.
+
+        Args:
+            name (str): Metric name
+            value (float): Observed value (seconds for latencies)
+            buckets (tuple[float], optional): Bucket upper bounds used when the series
+                is created. Defaults to DEFAULT_BUCKETS.
+            **labels: Label values identifying the time series
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram(buckets)
+            series[key].observe(value)
+
+    def counter_value(self, name, **labels):
+        """Get the current value of a counter.
+
+        Args:
+            name (str): Metric name
+            **labels: Label values identifying the time series
+
+        Returns:
+            float: Counter value, 0 if never incremented
+        """
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0)
+
+    def cache_hit_ratio(self, cache='default'):
+        """Compute the hit ratio of a cache from its hit/miss counters.
+
+        Args:
+            cache (str, optional): Cache label. Defaults to 'default'.
+
+        Returns:
+            float: Ratio of hits to lookups, 0.0 if there were no lookups
+        """
+        hits = self.counter_value('cache_hits_total', cache=cache)
+        misses = self.counter_value('cache_misses_total', cache=cache)
+        total = hits + misses
+        return hits / total if total else 0.0
+
+    def _cache_hit_ratios(self):
+        """Compute hit ratios for every cache with recorded lookups. Must be called with the lock held.
+
+        Returns:
+            dict: Mapping of label keys to hit ratios
+        """
+        hits = self._counters.get('cache_hits_total', {})
+        misses = self._counters.get('cache_misses_total', {})
+        ratios = {}
+        for key in set(hits) | set(misses):
+            total = hits.get(key, 0) + misses.get(key, 0)
+            ratios[key] = hits.get(key, 0) / total if total else 0.0
+        return ratios
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Context manager that observes the duration of its block.
+
+        Args:
+            name (str): Histogram metric name
+            **labels: Label values identifying the time series
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @contextmanager
+    def span(self, name, **attributes):
+        """Context manager that records a trace span around its block.
+
+        Spans nest per thread, so a span opened inside another records it as
+        its parent. Nothing is recorded when tracing is disabled.
+
+        Args:
+            name (str): Span name
+            **attributes: Extra attributes stored with the span
+
+        Yields:
+            dict: The span record, or None when tracing is disabled
+        """
+        if not self.tracing_enabled:
+            yield None
+            return
+
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        record = {
+            'name': name,
+            'parent': stack[-1]['name'] if stack else None,
+            'thread': threading.current_thread().name,
+            'start': time.time(),
+            'duration': None,
+            'error': None,
+            'attributes': attributes,
+        }
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record['error'] = type(e).__name__
+            raise
+        finally:
+            record['duration'] = time.perf_counter() - start
+            stack.pop()
+            with self._lock:
+                self._spans.append(record)
+                if len(self._spans) > self.max_spans:
+                    del self._spans[:len(self._spans) - self.max_spans]
+
+    def get_spans(self):
+        """Get a copy of the finished spans.
+
+        Returns:
+            list[dict]: Finished span records, oldest first
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def reset(self):
+        """Clear all counters, histograms and spans."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._spans.clear()
+
+    def to_prometheus(self):
+        """Export all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics in Prometheus text format
+        """
+        lines = []
+        with self._lock:
+            for name in sorted(self._counters):
+                lines.append(f'# TYPE {name} counter')
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f'{name}{_format_labels(key)} {value}')
+            for name in sorted(self._histograms):
+                lines.append(f'# TYPE {name} histogram')
+                for key, hist in sorted(self._histograms[name].items()):
+                    for bound, count in hist.cumulative():
+                        lines.append(f'{name}_bucket{_format_labels(key, [("le", bound)])} {count}')
+                    lines.append(f'{name}_bucket{_format_labels(key, [("le", "+Inf")])} {hist.count}')
+                    lines.append(f'{name}_sum{_format_labels(key)} {hist.sum}')
+                    lines.append(f'{name}_count{_format_labels(key)} {hist.count}')
+            ratios = self._cache_hit_ratios()
+            if ratios:
+                lines.append('# TYPE cache_hit_ratio gauge')
+                for key, ratio in sorted(ratios.items()):
+                    lines.append(f'cache_hit_ratio{_format_labels(key)} {ratio}')
+        return '\n'.join(lines) + '\n'
+
+    def to_dict(self):
+        """Export all metrics and spans as a JSON-serializable dictionary.
+
+        Returns:
+            dict: Counters, histograms, gauges (cache hit ratios) and spans
+        """
+        with self._lock:
+            counters = {
+                name: [{'labels': dict(key), 'value': value} for key, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            histograms = {
+                name: [
+                    {
+                        'labels': dict(key),
+                        'count': hist.count,
+                        'sum': hist.sum,
+                        'buckets': [{'le': bound, 'count': count} for bound, count in hist.cumulative()],
+                    }
+                    for key, hist in series.items()
+                ]
+                for name, series in self._histograms.items()
+            }
+            gauges = {
+                'cache_hit_ratio': [
+                    {'labels': dict(key), 'value': ratio} for key, ratio in self._cache_hit_ratios().items()
+                ]
+            }
+            spans = list(self._spans)
+        return {'counters': counters, 'histograms': histograms, 'gauges': gauges, 'spans': spans}
+
+    def to_json(self):
+        """Export all metrics and spans as a JSON string.
+
+        Returns:
+            str: Metrics serialized as JSON
+        """
+        return json.dumps(self.to_dict(), indent=2)
+
+    def export(self, filename, format_type='prom'):
+        """Write metrics to a file.
+
+        Args:
+            filename (str): Output file path
+            format_type (str, optional): Export format (prom/json). Defaults to 'prom'.
+
+        Returns:
+            str: Path to the written file
+        """
+        content = self.to_json() if format_type == 'json' else self.to_prometheus()
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return filename
+
+
+# Shared registry used throughout the application
+metrics = MetricsRegistry()
+
+
+def traced(name=None):
+    """Decorator that wraps a function call in a trace span and latency timer.
+
+    Args:
+        name (str, optional): Span name. Defaults to the function's qualified name.
+
+    Returns:
+        callable: The decorator
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with metrics.span(span_name), metrics.timer('call_duration_seconds', function=span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,192 @@
+"""
+Prefetcher module for loading search results ahead of the user.
+
+This module runs book searches on background threads so that the next page of
+results, and searches the user is likely to run next, are already loaded by
+the time they are needed. Pages run on their own threads so speculative
+searches never delay them.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from app.functional.logging_config import get_logger
+from app.functional.metrics import metrics
+
+# Number of results requested per page when browsing
+PAGE_SIZE = 10
+# Number of searches whose results are kept for reuse
+MAX_CACHED_SEARCHES = 128
+# Seconds a book must stay on screen before related searches are warmed
+WARM_DELAY = 1.0
+
+
+class Prefetcher:
+    """Runs book searches in the background and hands out their results.
+
+    Each distinct search is only submitted once; asking for it again returns the
+    pending or finished result instead of starting a new request. Only the
+    most recently used searches are kept.
+
+    Pages run on their own threads. Speculative searches run on a single
+    separate thread, and only for a book that stayed on screen for
+    `warm_delay` seconds, so paging quickly neither waits behind them nor
+    spends API quota on them.
+
+    Attributes:
+        book_finder (BookFinderBase): The book finder used for searches
+        page_size (int): Number of results per page
+        max_cached (int): Number of searches kept for reuse
+        warm_delay (float): Seconds a book must stay on screen before related searches are warmed
+    """
+
+    def __init__(self, book_finder, page_size=PAGE_SIZE, max_workers=2, max_cached=MAX_CACHED_SEARCHES,
+                 warm_delay=WARM_DELAY):
+        """Initialize the prefetcher.
+
+        Args:
+            book_finder (BookFinderBase): The book finder used for searches
+            page_size (int, optional): Number of results per page. Defaults to PAGE_SIZE.
+            max_workers (int, optional): Number of threads loading pages. Defaults to 2.
+            max_cached (int, optional): Number of searches kept. Defaults to MAX_CACHED_SEARCHES.
+            warm_delay (float, optional): Seconds before related searches are warmed. Defaults to WARM_DELAY.
+        """
+        self.book_finder = book_finder
+        self.page_size = page_size
+        self.max_cached = max_cached
+        self.warm_delay = warm_delay
+        self.logger = get_logger('prefetch')
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='prefetch')
+        self._speculative_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch-warm')
+        self._futures = OrderedDict()
+        self._speculative = set()
+        self._warm_timer = None
+        self._lock = threading.Lock()
+
+    def submit(self, query=None, title=None, author=None, lang=None, start_index=0, speculative=False):
+        """Start a search in the background unless it is already pending or done.
+
+        A search needed now that is still queued as a speculative one is moved
+        to the page threads, so it does not wait behind other warm-ups.
+
+        Args:
+            query (str, optional): General search query
+            title (str, optional): Title to search for
+            author (str, optional): Author to search for
+            lang (str, optional): Language to filter by
+            start_index (int, optional): Index of the first result. Defaults to 0.
+            speculative (bool, optional): Run on the speculative thread. Defaults to False.
+
+        Returns:
+            Future: Future resolving to the list of found books
+        """
+        key = (query, title, author, lang, start_index)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None and not speculative and key in self._speculative and future.cancel():
+                future = None
+            if future is None:
+                metrics.inc('prefetch_submitted_total', speculative=speculative)
+                executor = self._speculative_executor if speculative else self._executor
+                future = executor.submit(
+                    self.book_finder.search_books, query, title, author, lang,
+                    start_index=start_index, max_results=self.page_size
+                )
+                self._futures[key] = future
+                if speculative:
+                    self._speculative.add(key)
+                else:
+                    self._speculative.discard(key)
+                if len(self._futures) > self.max_cached:
+                    evicted, _ = self._futures.popitem(last=False)
+                    self._speculative.discard(evicted)
+            else:
+                self._futures.move_to_end(key)
+            return future
+
+    def get_page(self, query=None, title=None, author=None, lang=None, page=0, timeout=None):
+        """Get a page of results, waiting for it if it is still loading.
+
+        Args:
+            query (str, optional): General search query
+            title (str, optional): Title to search for
+            author (str, optional): Author to search for
+            lang (str, optional): Language to filter by
+            page (int, optional): Zero-based page number. Defaults to 0.
+            timeout (float, optional): Seconds to wait for the result
+
+        Returns:
+            list[Book]: Books on the requested page. The list is shared with the
+                cache and must not be modified.
+        """
+        future = self.submit(query, title, author, lang, start_index=page * self.page_size)
+        metrics.inc('prefetch_used_total', ready=future.done())
+        try:
+            return future.result(timeout=timeout)
+        except Exception as e:
+            self.logger.error(f"Prefetched search failed: {str(e)}")
+            return []
+
+    def is_full_page(self, books):
+        """Check whether a page of results was full, so more results may follow.
+
+        Uses the number of items the API returned, which can be larger than
+        the number of books once near-duplicates are dropped.
+
+        Args:
+            books (list[Book]): Books on the page
+
+        Returns:
+            bool: True if the next page should be loaded
+        """
+        return getattr(books, 'item_count', len(books)) >= self.page_size
+
+    def prefetch_page(self, query=None, title=None, author=None, lang=None, page=0):
+        """Start loading a page of results in the background.
+
+        Args:
+            query (str, optional): General search query
+            title (str, optional): Title to search for
+            author (str, optional): Author to search for
+            lang (str, optional): Language to filter by
+            page (int, optional): Zero-based page number. Defaults to 0.
+        """
+        self.submit(query, title, author, lang, start_index=page * self.page_size)
+
+    def warm_related(self, book, lang=None):
+        """Speculatively load searches the user is likely to run for a book.
+
+        Once the book has stayed on screen for `warm_delay` seconds, this loads
+        other books by the same author and the same title in any language.
+        Moving on to another book before then cancels the warm-up.
+
+        Args:
+            book (Book): The book currently being viewed
+            lang (str, optional): Language filter of the current search
+        """
+        timer = threading.Timer(self.warm_delay, self._warm, args=(book, lang))
+        timer.daemon = True
+        with self._lock:
+            if self._warm_timer is not None:
+                self._warm_timer.cancel()
+            self._warm_timer = timer
+        timer.start()
+
+    def _warm(self, book, lang):
+        """Submit the speculative searches for a book."""
+        try:
+            if book.authors:
+                self.submit(author=book.authors[0], lang=lang, speculative=True)
+            if book.title:
+                self.submit(title=book.title, speculative=True)
+        except RuntimeError:
+            # The prefetcher was shut down while the timer fired
+            pass
+
+    def shutdown(self):
+        """Cancel pending searches and stop the background threads."""
+        with self._lock:
+            if self._warm_timer is not None:
+                self._warm_timer.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._speculative_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,95 @@
+"""
+RecentBooks module for tracking recently viewed books.
+
+This module provides a fixed-capacity, deduplicating store of recently viewed
+books. Viewing a book again moves it to the front instead of adding a copy, and
+the oldest book is dropped once the capacity is reached. All updates are O(1).
+"""
+
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+
+def book_key(book_data):
+    """Get the identity of a book used to detect duplicates.
+
+    Google Books info links carry the volume id in their "id" parameter,
+    alongside the search query and a host that varies between links to the
+    same volume, so only the id is used. Other links are used as a whole;
+    without a link the title and authors identify the book.
+
+    Args:
+        book_data (dict): Book dictionary as returned by Book.to_dict
+
+    Returns:
+        tuple: A hashable key identifying the book
+    """
+    link = book_data.get('info_link')
+    if link:
+        volume_id = parse_qs(urlsplit(link).query).get('id')
+        if volume_id:
+            return ('id', volume_id[0])
+        return ('link', link)
+    return ('title', (book_data.get('title') or '').lower(), tuple(book_data.get('authors') or []))
+
+
+class RecentBooks:
+    """A fixed-capacity ring of recently viewed books with move-to-front semantics.
+
+    Attributes:
+        capacity (int): Maximum number of books kept
+    """
+
+    def __init__(self, capacity=100, books=None):
+        """Initialize the recent books store.
+
+        Args:
+            capacity (int, optional): Maximum number of books kept. Defaults to 100.
+            books (list, optional): Book dictionaries to load, most recent first
+        """
+        self.capacity = capacity
+        # Ordered from oldest to most recent, so eviction pops from the front
+        self._books = OrderedDict()
+        for book_data in reversed(books or []):
+            self.add(book_data)
+
+    def add(self, book_data):
+        """Add a book or move it to the front if it is already present.
+
+        Args:
+            book_data (dict): Book dictionary to add
+
+        Returns:
+            bool: True if the order or contents changed, False if the book was already the most recent
+        """
+        key = book_key(book_data)
+        if key in self._books:
+            if next(reversed(self._books)) == key:
+                return False
+            self._books.move_to_end(key)
+            self._books[key] = book_data
+            return True
+        self._books[key] = book_data
+        if len(self._books) > self.capacity:
+            self._books.popitem(last=False)
+        return True
+
+    def to_list(self):
+        """Get the books as a list, most recent first.
+
+        Returns:
+            list: Book dictionaries, most recent first
+        """
+        return list(reversed(self._books.values()))
+
+    def __iter__(self):
+        """Iterate over the books, most recent first."""
+        return reversed(self._books.values())
+
+    def __len__(self):
+        """Get the number of books stored."""
+        return len(self._books)
+
+    def __contains__(self, book_data):
+        """Check whether a book is stored."""
+        return book_key(book_data) in self._books
@@ -5,9 +5,16 @@ This module implements the BookFinderBase interface to search for books using
 the Google Books API, providing real book data from Google's extensive database.
 """
 
-import logging
+import threading
+import time
+from collections import OrderedDict
 import requests
 from app.functional.book_finder_base import BookFinderBase
+from app.functional.logging_config import get_logger
+from app.functional.metrics import metrics, traced
+
+# Largest page size accepted by the volumes endpoint
+MAX_PAGE_SIZE = 40
 
 class GoogleBooksFinder(BookFinderBase):
     """Implementation of BookFinderBase using the Google Books API.
@@ -16,41 +23,126 @@ class GoogleBooksFinder(BookFinderBase):
     handling API requests, response parsing, and error management.
     """
     
-    def __init__(self):
-        """Initialize the Google Books finder with the API endpoint."""
-        super().__init__()
+    def __init__(self, cache_size=256, dedupe_results=False):
+        """Initialize the Google Books finder with the API endpoint.
+
+        Args:
+            cache_size (int, optional): Number of result pages to cache. Defaults to 256.
+            dedupe_results (bool, optional): Drop near-duplicate editions from results. Defaults to False.
+        """
+        super().__init__(dedupe_results)
+        self.logger = get_logger('google')
         self.api_url = "https://www.googleapis.com/books/v1/volumes"
+        # A shared session keeps connections alive across searches and prefetches
+        self.session = requests.Session()
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cache_lock = threading.Lock()
+
+    def build_params(self, query, title=None, author=None, lang=None, start_index=0, max_results=None):
+        """Build the API request parameters for a search.
+
+        Args:
+            query (str): General search query
+            title (str, optional): Title to search for
+            author (str, optional): Author to search for
+            lang (str, optional): Language to filter by
+            start_index (int, optional): Index of the first result. Defaults to 0.
+            max_results (int, optional): Page size (the API allows up to 40)
+
+        Returns:
+            dict: Query parameters for the volumes endpoint
+        """
+        search_query = []
+        if query:
+            search_query.append(query)
+        if title:
+            search_query.append(f"intitle:{title}")
+        if author:
+            search_query.append(f"inauthor:{author}")
+        if lang:
+            search_query.append(f"lang:{lang}")
+
+        params = {'q': '+'.join(search_query)}
+        if start_index:
+            params['startIndex'] = start_index
+        if max_results:
+            params['maxResults'] = min(max_results, MAX_PAGE_SIZE)
+        return params
 
-    def search_books(self, query, title=None, author=None, lang=None):
+    def fetch_volumes(self, params):
+        """Send a request to the volumes endpoint and return the raw response data.
+
+        Args:
+            params (dict): Query parameters for the volumes endpoint
+
+        Returns:
+            dict: Decoded JSON response
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        start = time.perf_counter()
+        response = self.session.get(self.api_url, params=params)
+        self.record_http_metrics(response, time.perf_counter() - start)
+        response.raise_for_status()
+        return response.json()
+
+    @traced('GoogleBooksFinder.search_books')
+    def search_books(self, query, title=None, author=None, lang=None, start_index=0, max_results=None):
         """Search for books using the Google Books API.
         
         This method constructs and sends a search request to the Google Books API,
-        handling query parameters and response parsing.
+        handling query parameters and response parsing. Successful results are
+        cached, so repeated and prefetched searches do not hit the network again.
         
         Args:
             query (str): General search query
             title (str, optional): Title to search for
             author (str, optional): Author to search for
             lang (str, optional): Language to filter by
+            start_index (int, optional): Index of the first result. Defaults to 0.
+            max_results (int, optional): Page size (the API allows up to 40)
             
         Returns:
             list[Book]: List of found books matching the search criteria
         """
+        params = self.build_params(query, title, author, lang, start_index, max_results)
+        key = tuple(sorted(params.items()))
+        with self.cache_lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                metrics.inc('cache_hits_total', cache='search')
+                return self.cache[key].copy()
+        metrics.inc('cache_misses_total', cache='search')
+
         try:
-            search_query = []
-            if query:
-                search_query.append(query)
-            if title:
-                search_query.append(f"intitle:{title}")
-            if author:
-                search_query.append(f"inauthor:{author}")
-            if lang:
-                search_query.append(f"lang:{lang}")
-
-            params = {'q': '+'.join(search_query)}
-            response = requests.get(self.api_url, params=params)
-            response.raise_for_status()
-            return self.handle_response(response.json())
+            books = self.handle_response(self.fetch_volumes(params))
         except requests.exceptions.RequestException as e:
-            logging.error(f"Google Books API request failed: {str(e)}")
-            return [] 
\ No newline at end of file
+            metrics.inc('http_errors_total', error=type(e).__name__)
+            self.logger.error(f"Google Books API request failed: {str(e)}")
+            return []
+
+        with self.cache_lock:
+            self.cache[key] = books
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return books.copy()
+
+    def record_http_metrics(self, response, total):
+        """Record latency and size metrics for a completed API request.
+
+        `requests` does not expose DNS, connect and TLS timings separately, so the
+        request is split into the wait until response headers were parsed (which
+        covers connection setup and server time) and the body transfer after it.
+
+        Args:
+            response (requests.Response): The API response
+            total (float): Total request duration in seconds
+        """
+        wait = response.elapsed.total_seconds()
+        metrics.inc('http_requests_total', status=response.status_code)
+        metrics.inc('http_response_bytes_total', len(response.content))
+        metrics.observe('http_request_duration_seconds', total)
+        metrics.observe('http_wait_duration_seconds', wait)
+        metrics.observe('http_transfer_duration_seconds', max(total - wait, 0.0)) 
\ No newline at end of file
@@ -7,6 +7,7 @@ a consistent interface for testing the application without making actual API cal
 
 from app.functional.book_finder_base import BookFinderBase
 from app.functional.book import Book
+from app.functional.metrics import traced
 
 class MockBooksFinder(BookFinderBase):
     """Implementation of BookFinderBase using mock data.
@@ -35,7 +36,8 @@ class MockBooksFinder(BookFinderBase):
             )
         ]
 
-    def search_books(self, query, title=None, author=None, lang=None):
+    @traced('MockBooksFinder.search_books')
+    def search_books(self, query, title=None, author=None, lang=None, start_index=0, max_results=None):
         """Search for books using mock data.
         
         This method filters the mock book data based on the provided search criteria,
@@ -46,6 +48,8 @@ class MockBooksFinder(BookFinderBase):
             title (str, optional): Title to search for
             author (str, optional): Author to search for
             lang (str, optional): Language to filter by
+            start_index (int, optional): Index of the first result. Defaults to 0.
+            max_results (int, optional): Maximum number of results to return
             
         Returns:
             list[Book]: List of mock books matching the search criteria
@@ -62,4 +66,5 @@ class MockBooksFinder(BookFinderBase):
                             any(query.lower() in a.lower() for a in b.authors) or
                             query.lower() in b.description.lower()]
         
-        return filtered_books 
\ No newline at end of file
+        end = start_index + max_results if max_results else None
+        return filtered_books[start_index:end] 
\ No newline at end of file
@@ -5,15 +5,20 @@ This module provides the user interface for searching and displaying books,
 including interactive navigation through search results and adding books to favorites.
 """
 
+from app.functional.prefetch import Prefetcher
 from app.ui.utils import console, Panel, Prompt, Table
 
-def display_book(book, current_index, total_books):
+# Start loading the next page when this many results are left on the current one
+PREFETCH_THRESHOLD = 3
+
+def display_book(book, current_index, total_books, has_more=False):
     """Display a book's details in a formatted panel.
     
     Args:
         book (Book): The book object to display
         current_index (int): Current book's position in the search results
         total_books (int): Total number of books in the search results
+        has_more (bool, optional): Whether more results may still be loaded
     """
     console.print(Panel.fit(
         f"[bold blue]📘 {book.title}[/bold blue]\n"
@@ -21,15 +26,17 @@ def display_book(book, current_index, total_books):
         f"[yellow]Published:[/yellow] {book.published_date or 'Unknown'}\n"
         f"[yellow]Summary:[/yellow] {book.description or 'No description available'}\n"
         f"[yellow]More Info:[/yellow] {book.info_link}",
-        title=f"Book {current_index}/{total_books}"
+        title=f"Book {current_index}/{total_books}{'+' if has_more else ''}"
     ))
 
-def search_books(book_finder, favorites_manager, query=None, title=None, author=None, lang=None):
+def search_books(book_finder, favorites_manager, query=None, title=None, author=None, lang=None, prefetcher=None):
     """Search for books and provide interactive navigation through results.
     
     This function handles the book search process, displaying results and allowing
     users to navigate through them, add books to favorites, and view a list of all
-    search results.
+    search results. Results are loaded a page at a time: the next page is fetched
+    in the background as the user nears the end of the loaded results, and
+    searches for the same author or title are warmed once a book stays on screen.
     
     Args:
         book_finder (BookFinderBase): The book finder implementation to use
@@ -38,35 +45,75 @@ def search_books(book_finder, favorites_manager, query=None, title=None, author=
         title (str, optional): Title to search for
         author (str, optional): Author to search for
         lang (str, optional): Language to filter by
+        prefetcher (Prefetcher, optional): Prefetcher shared with a parent search
     """
     if not any([query, title, author]):
         query = Prompt.ask("🔍 Enter a book title, author, or keyword")
+
+    owns_prefetcher = prefetcher is None
+    if owns_prefetcher:
+        prefetcher = Prefetcher(book_finder)
+    try:
+        navigate_results(book_finder, favorites_manager, prefetcher, query, title, author, lang)
+    finally:
+        if owns_prefetcher:
+            prefetcher.shutdown()
+
+def navigate_results(book_finder, favorites_manager, prefetcher, query, title, author, lang):
+    """Interactively navigate through paged search results.
     
-    books = book_finder.search_books(query, title, author, lang)
+    Args:
+        book_finder (BookFinderBase): The book finder implementation to use
+        favorites_manager (FavoritesManager): Manager for handling favorites
+        prefetcher (Prefetcher): Prefetcher used to load result pages
+        query (str): General search query
+        title (str): Title to search for
+        author (str): Author to search for
+        lang (str): Language to filter by
+    """
+    search = dict(query=query, title=title, author=author, lang=lang)
+    page = prefetcher.get_page(**search, page=0)
+    # Copy the page so extending it does not change the prefetcher's cached result
+    books = list(page)
     
     if not books:
         console.print("[red]No books found. Try a different search term.[/red]")
         return
 
+    next_page = 1
+    has_more = prefetcher.is_full_page(page)
     current_index = 0
     while current_index < len(books):
+        if has_more and current_index >= len(books) - PREFETCH_THRESHOLD:
+            prefetcher.prefetch_page(**search, page=next_page)
+
         book = books[current_index]
         favorites_manager.add_recent(book)
-        display_book(book, current_index + 1, len(books))
+        prefetcher.warm_related(book, lang)
+        display_book(book, current_index + 1, len(books), has_more)
         
         console.print("\nOptions:")
         console.print("[yellow]y[/yellow] - Add to favorites (with optional note)")
         console.print("[yellow]n[/yellow] - Next book")
         console.print("[yellow]b[/yellow] - Previous book")
         console.print("[yellow]l[/yellow] - List view of all books")
+        console.print("[yellow]a[/yellow] - More by this author")
+        console.print("[yellow]t[/yellow] - Same title in other languages/editions")
         console.print("[yellow]q[/yellow] - Quit to main menu")
         
         action = Prompt.ask(
             "Choose action",
-            choices=["y", "n", "l", "b", "q"],
+            choices=["y", "n", "l", "b", "a", "t", "q"],
             default="n"
         )
         
+        # A page can be empty after near-duplicates are dropped, so keep loading until one has books
+        while action in ("y", "n") and current_index == len(books) - 1 and has_more:
+            page = prefetcher.get_page(**search, page=next_page)
+            books.extend(page)
+            next_page += 1
+            has_more = prefetcher.is_full_page(page)
+
         if action == "y":
             note = Prompt.ask("Add a note (leave blank to skip)")
             if favorites_manager.add_favorite(book, note):
@@ -88,5 +135,9 @@ def search_books(book_finder, favorites_manager, query=None, title=None, author=
             current_index = int(selection) - 1
         elif action == "b" and current_index > 0:
             current_index -= 1
+        elif action == "a" and book.authors:
+            search_books(book_finder, favorites_manager, author=book.authors[0], lang=lang, prefetcher=prefetcher)
+        elif action == "t":
+            search_books(book_finder, favorites_manager, title=book.title, prefetcher=prefetcher)
         elif action == "q":
-            break
\ No newline at end of file
+            break
@@ -0,0 +1,88 @@
+"""
+Crawl UI handler module for running bulk catalog crawls.
+
+This module provides the user interface for crawling all results of a list of
+seed queries into a local catalog, showing throughput and remaining quota live.
+"""
+
+import threading
+from rich.live import Live
+from app.functional.crawler import CrawlJob
+from app.functional.logging_config import console_suspended
+from app.ui.utils import console, Table
+
+
+def render_crawl_stats(stats, stopping=False):
+    """Build a table showing the progress of a crawl.
+
+    Args:
+        stats (dict): Progress statistics from CrawlJob.stats
+        stopping (bool, optional): Whether the crawl is shutting down
+
+    Returns:
+        Table: The progress table
+    """
+    title = "📥 Crawling catalog" + (" (stopping after current pages...)" if stopping else "")
+    table = Table(show_header=False, title=title)
+    table.add_column("Metric", style="yellow")
+    table.add_column("Value")
+    table.add_row("Seeds finished", f"{stats['seeds_done']}/{stats['seeds_total']}")
+    table.add_row("Volumes fetched", str(stats['fetched']))
+    table.add_row("New volumes", str(stats['added']))
+    table.add_row("Catalog size", str(stats['catalog_size']))
+    table.add_row("Throughput", f"{stats['volumes_per_second']:.1f} volumes/sec")
+    table.add_row("Requests", str(stats['requests']))
+    table.add_row("Remaining quota", str(stats['remaining_quota']))
+    table.add_row("Elapsed", f"{stats['elapsed']:.1f}s")
+    return table
+
+
+def run_crawl(book_finder, seeds_file, catalog_path='catalog/catalog.jsonl', quota=1000, workers=4):
+    """Crawl all results for the seed queries in a file into a local catalog.
+
+    The crawl resumes from its checkpoint if it was interrupted before.
+    Pressing Ctrl+C stops it after the pages currently being fetched.
+
+    Args:
+        book_finder (BookFinderBase): The book finder implementation to use
+        seeds_file (str): File with one seed query per line
+        catalog_path (str, optional): Path to the catalog. Defaults to 'catalog/catalog.jsonl'.
+        quota (int, optional): Maximum API requests across runs. Defaults to 1000.
+        workers (int, optional): Seeds crawled concurrently. Defaults to 4.
+    """
+    if not hasattr(book_finder, 'fetch_volumes'):
+        console.print("[red]Crawling requires the Google Books finder (run without --mock).[/red]")
+        return
+
+    with open(seeds_file, 'r', encoding='utf-8') as f:
+        seeds = f.read().splitlines()
+
+    job = CrawlJob(book_finder, seeds, catalog_path, workers=workers, quota=quota)
+    errors = []
+
+    def work():
+        try:
+            job.run()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=work, name='crawl-job')
+    thread.start()
+    stopping = False
+    with console_suspended(), Live(render_crawl_stats(job.stats()), console=console, refresh_per_second=4) as live:
+        while thread.is_alive():
+            try:
+                thread.join(timeout=0.25)
+            except KeyboardInterrupt:
+                job.stop()
+                stopping = True
+            live.update(render_crawl_stats(job.stats(), stopping))
+
+    if errors:
+        console.print(f"[red]Crawl failed: {errors[0]}[/red]")
+        return
+    stats = job.stats()
+    if stats['seeds_done'] < stats['seeds_total']:
+        console.print(f"[yellow]⏸ Crawl stopped. Run it again to resume from {job.checkpoint_path}.[/yellow]")
+    else:
+        console.print(f"[green]✅ Crawl finished: {stats['catalog_size']} volumes in {catalog_path}[/green]")
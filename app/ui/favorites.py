@@ -5,8 +5,13 @@ This module provides the user interface for viewing, managing, and exporting
 favorite books, including filtering and detailed view functionality.
 """
 
+from app.functional.favorites_index import SORT_KEYS
 from app.ui.utils import console, Prompt, Table, Panel, os, datetime
 
+# Number of favorites shown per page
+PAGE_SIZE = 10
+SORT_ORDERS = list(SORT_KEYS)
+
 
 def display_favorite_book(book):
     """Display a favorite book's details in a formatted panel.
@@ -26,68 +31,163 @@ def display_favorite_book(book):
 
 
 def view_favorites(favorites_manager, author=None, title=None):
-    """View and manage favorite books with filtering options.
+    """View and manage favorite books with sorting, faceting and filtering options.
     
-    This function displays a list of favorite books and provides options to
-    view details, remove books, filter the list, or return to the main menu.
+    This function displays favorite books one page at a time and provides
+    options to page through them, change the sort order, narrow them down by
+    author, year or language, view details, remove books, filter the list, or
+    return to the main menu. Only the rows of the visible page are rendered.
     
     Args:
         favorites_manager (FavoritesManager): Manager for handling favorites
         author (str, optional): Author name to filter by
         title (str, optional): Title to filter by
     """
-    favorites = favorites_manager.filter_favorites(author, title)
-    if not favorites:
-        console.print("[yellow]No favorite books yet![/yellow]")
-        return
+    filtered = favorites_manager.filter_favorites(author, title) if author or title else None
+    sort, descending = 'title', False
+    facet = value = None
+    page = 0
 
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Index")
-    table.add_column("Title")
-    table.add_column("Author(s)")
-    table.add_column("Note")
-    
-    for i, book in enumerate(favorites, 1):
-        table.add_row(
-            str(i),
-            book.title,
-            ', '.join(book.authors),
-            book.note or "No note"
-        )
-    
-    console.print(table)
-    
     while True:
+        if filtered is None:
+            favorites, total = favorites_manager.favorites_page(sort, descending, page, PAGE_SIZE, facet, value)
+        else:
+            total = len(filtered)
+            favorites = filtered[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+        if not total and facet:
+            # The last book of the facet value was removed; go back to all favorites
+            facet = value = None
+            page = 0
+            continue
+        if not total:
+            console.print("[yellow]No favorite books yet![/yellow]")
+            return
+        pages = (total + PAGE_SIZE - 1) // PAGE_SIZE
+        if page >= pages:
+            page = pages - 1
+            continue
+
+        view = f"sorted by {sort}{' (descending)' if descending else ''}" if filtered is None else "filtered"
+        if facet:
+            view += f", {facet}: {value}"
+        table = Table(show_header=True, header_style="bold magenta",
+                      title=f"Favorites {view} - page {page + 1}/{pages} ({total} books)")
+        table.add_column("Index")
+        table.add_column("Title")
+        table.add_column("Author(s)")
+        table.add_column("Note")
+        
+        first = page * PAGE_SIZE + 1
+        for i, book in enumerate(favorites, first):
+            table.add_row(
+                str(i),
+                book.title,
+                ', '.join(book.authors),
+                book.note or "No note"
+            )
+        
+        console.print(table)
+        numbers = [str(i) for i in range(first, first + len(favorites))]
+
         console.print("\nOptions:")
+        console.print("[yellow]n[/yellow] - Next page")
+        console.print("[yellow]p[/yellow] - Previous page")
+        console.print("[yellow]o[/yellow] - Change sort order")
+        console.print("[yellow]f[/yellow] - Browse by author, year or language")
         console.print("[yellow]v[/yellow] - View book details")
         console.print("[yellow]r[/yellow] - Remove a book from favorites")
         console.print("[yellow]s[/yellow] - Search/filter favorites")
+        console.print("[yellow]d[/yellow] - Find and merge duplicates")
         console.print("[yellow]q[/yellow] - Quit to main menu")
         
         action = Prompt.ask(
             "Choose action",
-            choices=["v", "r", "s", "q"],
+            choices=["n", "p", "o", "f", "v", "r", "s", "d", "q"],
             default="q"
         )
         
-        if action == "v":
-            selection = Prompt.ask("Enter book number to view", choices=[str(i) for i in range(1, len(favorites) + 1)])
-            book = favorites[int(selection) - 1]
+        if action == "n" and page < pages - 1:
+            page += 1
+        elif action == "p" and page > 0:
+            page -= 1
+        elif action == "o":
+            sort = Prompt.ask("Sort by", choices=SORT_ORDERS, default=sort)
+            descending = Prompt.ask("Order", choices=["asc", "desc"], default="asc") == "desc"
+            filtered = None
+            page = 0
+        elif action == "f":
+            facet, value = choose_facet(favorites_manager)
+            filtered = None
+            page = 0
+        elif action == "v":
+            selection = Prompt.ask("Enter book number to view", choices=numbers)
+            book = favorites[int(selection) - first]
             display_favorite_book(book)
         elif action == "r":
-            selection = Prompt.ask("Enter book number to remove", choices=[str(i) for i in range(1, len(favorites) + 1)])
-            book = favorites[int(selection) - 1]
+            selection = Prompt.ask("Enter book number to remove", choices=numbers)
+            book = favorites[int(selection) - first]
             favorites_manager.remove_favorite(book.title)
+            if filtered is not None:
+                filtered = [b for b in filtered if b.title != book.title]
             console.print("[green]✅ Book removed from favorites![/green]")
-            break
         elif action == "s":
             author = Prompt.ask("Filter by author (leave blank to skip)")
             title = Prompt.ask("Filter by title (leave blank to skip)")
             view_favorites(favorites_manager, author, title)
             break
+        elif action == "d":
+            merge_duplicates(favorites_manager)
+            break
         elif action == "q":
             break
 
+def choose_facet(favorites_manager):
+    """Let the user pick a facet value to browse favorites by.
+    
+    Args:
+        favorites_manager (FavoritesManager): Manager for handling favorites
+        
+    Returns:
+        tuple: (facet name, facet value), or (None, None) to show all favorites
+    """
+    facet = Prompt.ask("Browse by", choices=["author", "year", "language", "all"], default="author")
+    if facet == "all":
+        return None, None
+
+    counts = favorites_manager.facet_counts(facet)
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Index")
+    table.add_column(facet.capitalize())
+    table.add_column("Books")
+    for i, (value, count) in enumerate(counts, 1):
+        table.add_row(str(i), value, str(count))
+    console.print(table)
+
+    selection = Prompt.ask(f"Enter {facet} number", choices=[str(i) for i in range(1, len(counts) + 1)])
+    return facet, counts[int(selection) - 1][0]
+
+def merge_duplicates(favorites_manager):
+    """Find near-duplicate favorites and merge them after confirmation.
+    
+    Args:
+        favorites_manager (FavoritesManager): Manager for handling favorites
+    """
+    report = favorites_manager.dedupe_favorites(dry_run=True)
+    if not report.groups:
+        console.print("[green]✅ No duplicates found![/green]")
+        return
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Kept")
+    table.add_column("Duplicates")
+    for merged, duplicates in report.groups:
+        table.add_row(merged['title'], '\n'.join(d['title'] for d in duplicates))
+    console.print(table)
+
+    if Prompt.ask(f"Merge {len(report.groups)} duplicate group(s)?", choices=["y", "n"], default="n") == "y":
+        report = favorites_manager.dedupe_favorites()
+        console.print(f"[green]✅ Merged {report.original_count} books into {report.merged_count}![/green]")
+
 def export_favorites(favorites_manager, format_type=None, filename=None):
     """Export favorite books to a file in various formats.
     
@@ -0,0 +1,94 @@
+"""
+Live search UI handler module for search-as-you-type.
+
+This module provides an interactive search mode where results update while the
+user types. Pressing Enter opens the current results in the regular book
+navigator; Escape returns to the main menu.
+"""
+
+from rich.console import Group
+from rich.live import Live
+from rich.text import Text
+from app.functional.live_search import IncrementalSearch
+from app.functional.logging_config import console_suspended
+from app.ui.books import search_books
+from app.ui.utils import console, Table, raw_keys, read_key
+
+
+def render_live_results(text, shown_query, books, pending):
+    """Build the renderable for the live search screen.
+
+    Args:
+        text (str): What the user has typed so far
+        shown_query (str): Query the displayed results belong to
+        books (list[Book]): Books to display
+        pending (bool): Whether a request for the current text is in flight
+
+    Returns:
+        Group: The renderable for the live display
+    """
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Index")
+    table.add_column("Title")
+    table.add_column("Author(s)")
+    for i, book in enumerate(books, 1):
+        table.add_row(str(i), book.title, ', '.join(book.authors))
+
+    if pending:
+        status = f"[yellow]Searching... showing {len(books)} already loaded match(es)[/yellow]"
+    elif text and not books:
+        status = "[red]No books found.[/red]"
+    elif text:
+        status = f"[green]{len(books)} result(s) for '{shown_query}'[/green]"
+    else:
+        status = "[dim]Start typing to search[/dim]"
+
+    return Group(
+        Text.from_markup(f"🔍 [bold]{text}[/bold]▌"),
+        table,
+        Text.from_markup(status),
+        Text.from_markup("[dim]Enter - browse results  •  Esc - back to menu[/dim]"),
+    )
+
+
+def live_search(book_finder, favorites_manager, lang=None):
+    """Search for books while the user types.
+
+    Each keystroke updates the results: cached and already loaded books are
+    filtered immediately, and the API is queried once typing pauses. Pressing
+    Enter opens the current query in the book navigator.
+
+    Args:
+        book_finder (BookFinderBase): The book finder implementation to use
+        favorites_manager (FavoritesManager): Manager for handling favorites
+        lang (str, optional): Language to filter by
+    """
+    search = IncrementalSearch(book_finder, lang)
+    text = ''
+    try:
+        with console_suspended(), raw_keys(), Live(render_live_results(text, '', [], False), console=console,
+                              auto_refresh=False, transient=True) as live:
+            last_version = None
+            while True:
+                key = read_key(timeout=0.05)
+                if key == 'escape':
+                    text = ''
+                    break
+                if key == 'enter':
+                    break
+                if key == 'backspace':
+                    text = text[:-1]
+                    search.update(text)
+                elif key and len(key) == 1 and key.isprintable():
+                    text += key
+                    search.update(text)
+
+                version, shown_query, books, pending = search.snapshot()
+                if key is not None or version != last_version:
+                    live.update(render_live_results(text, shown_query, books, pending), refresh=True)
+                    last_version = version
+    finally:
+        search.close()
+
+    if text.strip():
+        search_books(book_finder, favorites_manager, query=text.strip(), lang=lang)
@@ -15,7 +15,7 @@ def display_menu():
     provides numbered options for different application features.
     
     Returns:
-        str: The user's menu choice (1-5)
+        str: The user's menu choice (1-6)
     """
     console.print(Panel.fit("📚 Jejo Book Finder", style="bold blue"))
     console.print("1. Search for books")
@@ -23,4 +23,6 @@ def display_menu():
     console.print("3. View recently viewed")
     console.print("4. Export favorites")
     console.print("5. Exit")
-    return Prompt.ask("Choose an option", choices=["1", "2", "3", "4", "5"])
\ No newline at end of file
+    # New options are appended so existing numbers keep their meaning
+    console.print("6. Live search (results as you type)")
+    return Prompt.ask("Choose an option", choices=["1", "2", "3", "4", "5", "6"])
\ No newline at end of file
@@ -19,6 +19,10 @@ Import and use the shared `console` instance:
     from app.ui.utils import console
     console.print("[bold green]Welcome![/bold green]")
 
+Read single keystrokes (for search-as-you-type) inside `raw_keys`:
+    with raw_keys():
+        key = read_key(timeout=0.1)
+
 Future extensions can include:
 - Custom loading indicators
 - Theming or layout presets
@@ -26,8 +30,18 @@ Future extensions can include:
 
 # --- Standard Library ---
 import os
+import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime
 
+if os.name == 'nt':
+    import msvcrt
+else:
+    import select
+    import termios
+    import tty
+
 # --- Third-Party Libraries ---
 from rich.console import Console
 from rich.prompt import Prompt
@@ -37,4 +51,78 @@ from rich.panel import Panel
 # --- Console Initialization ---
 console = Console()
 
-__all__ = ["console", "Prompt", "Table", "Panel"]
+# --- Keyboard Input ---
+@contextmanager
+def raw_keys():
+    """Switch the terminal to character-at-a-time input for the duration of the block.
+
+    Keystrokes are delivered without waiting for Enter and are not echoed.
+    Does nothing on Windows (which reads keys directly) or when stdin is not a terminal.
+    """
+    if os.name == 'nt' or not sys.stdin.isatty():
+        yield
+        return
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+def read_key(timeout=0.1):
+    """Read a single keystroke, waiting at most `timeout` seconds.
+
+    Args:
+        timeout (float, optional): Seconds to wait for a key. Defaults to 0.1.
+
+    Returns:
+        str: The typed character, "enter", "backspace" or "escape",
+            an empty string for other special keys, or None if no key was pressed
+    """
+    if os.name == 'nt':
+        deadline = time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.01)
+        char = msvcrt.getwch()
+        if char in ('\x00', '\xe0'):
+            msvcrt.getwch()
+            return ''
+    else:
+        fd = sys.stdin.fileno()
+        if not select.select([fd], [], [], timeout)[0]:
+            return None
+        data = os.read(fd, 1)
+        if not data:
+            return 'escape'
+        # Read the continuation bytes of a multi-byte UTF-8 character
+        lead = data[0]
+        remaining = 3 if lead >= 0xF0 else 2 if lead >= 0xE0 else 1 if lead >= 0xC0 else 0
+        while remaining:
+            more = os.read(fd, remaining)
+            if not more:
+                break
+            data += more
+            remaining -= len(more)
+        try:
+            char = data.decode('utf-8')
+        except UnicodeDecodeError:
+            return ''
+        if char == '\x1b':
+            # Drain the rest of an arrow/function key sequence
+            if select.select([fd], [], [], 0.01)[0]:
+                os.read(fd, 16)
+                return ''
+            return 'escape'
+
+    if char in ('\r', '\n'):
+        return 'enter'
+    if char in ('\x7f', '\x08'):
+        return 'backspace'
+    if char == '\x1b':
+        return 'escape'
+    return char
+
+__all__ = ["console", "Prompt", "Table", "Panel", "raw_keys", "read_key"]
@@ -6,16 +6,24 @@ arguments, initializing components, and managing the main application flow.
 """
 
 import argparse
+import os
 from app.google_books_finder import GoogleBooksFinder
 from app.mock_books_finder import MockBooksFinder
 from app.functional.favorites import FavoritesManager
+from app.functional.http_replay import use_cassette
+from app.functional.metrics import metrics
 from app.ui.utils import console
 from app.ui.books import search_books
+from app.ui.crawl import run_crawl
+from app.ui.live_search import live_search
 from app.ui.favorites import view_favorites, export_favorites
 from app.ui.menu import display_menu
 from app.ui.recents import view_recent
 
-def get_book_finder(use_mock=False):
+JSON_FAVORITES_FILE = 'favorites/favorites.json'
+BINARY_FAVORITES_FILE = 'favorites/favorites.jbf'
+
+def get_book_finder(use_mock=False, dedupe=False, api_url=None, record=None, replay=None):
     """Factory function to create the appropriate book finder.
     
     This function creates and returns either a real Google Books finder or
@@ -23,13 +31,42 @@ def get_book_finder(use_mock=False):
     
     Args:
         use_mock (bool): Whether to use the mock finder instead of Google Books
+        dedupe (bool): Whether to drop near-duplicate editions from search results
+        api_url (str): Volumes endpoint to use instead of the live API (e.g. a stub server)
+        record (str): Cassette directory to record live responses into
+        replay (str): Cassette directory to replay responses from instead of the network
         
     Returns:
         BookFinderBase: An instance of a book finder
     """
     if use_mock:
         return MockBooksFinder()
-    return GoogleBooksFinder()
+    finder = GoogleBooksFinder(dedupe_results=dedupe)
+    if api_url:
+        finder.api_url = api_url
+    if record:
+        use_cassette(finder, record, mode='record')
+    elif replay:
+        use_cassette(finder, replay, mode='replay')
+    return finder
+
+def get_favorites_file(filename=None):
+    """Choose the favorites file to use.
+    
+    Without an explicit file, a converted binary store (favorites/favorites.jbf)
+    is preferred over the JSON file when it exists.
+    
+    Args:
+        filename (str): Favorites file given on the command line
+        
+    Returns:
+        str: Path to the favorites file (".jbf" for the binary format)
+    """
+    if filename:
+        return filename
+    if os.path.exists(BINARY_FAVORITES_FILE):
+        return BINARY_FAVORITES_FILE
+    return JSON_FAVORITES_FILE
 
 def main():
     """Main application entry point.
@@ -48,16 +85,45 @@ def main():
     parser.add_argument("--favorites", action="store_true", help="View favorites")
     parser.add_argument("--export", help="Export favorites (format: csv/json/md)")
     parser.add_argument("--filename", help="Export filename")
+    parser.add_argument("--live", action="store_true", help="Search as you type")
+    parser.add_argument("--dedupe", action="store_true", help="Hide near-duplicate editions in search results")
+    parser.add_argument("--api-url", help="Volumes endpoint to use (e.g. a local stub server)")
+    parser.add_argument("--record", metavar="DIR", help="Record API responses into a cassette directory")
+    parser.add_argument("--replay", metavar="DIR", help="Replay API responses from a cassette directory")
+    parser.add_argument("--favorites-file", help="Favorites file to use (.jbf for the binary format)")
+    parser.add_argument("--crawl", metavar="SEEDS_FILE", help="Crawl all results for the queries in a file (one per line)")
+    parser.add_argument("--catalog", default="catalog/catalog.jsonl", help="Catalog file written by --crawl")
+    parser.add_argument("--quota", type=int, default=1000, help="Maximum API requests for --crawl, across resumed runs")
     parser.add_argument("--mock", action="store_true", help="Use mock book finder for testing")
+    parser.add_argument("--metrics", help="Write metrics on exit (.json for JSON, otherwise Prometheus text)")
+    parser.add_argument("--trace", action="store_true", help="Record trace spans in the metrics output")
     args = parser.parse_args()
 
-    book_finder = get_book_finder(args.mock)
-    favorites_manager = FavoritesManager()
+    metrics.tracing_enabled = args.trace
+    try:
+        run(args)
+    finally:
+        if args.metrics:
+            format_type = 'json' if args.metrics.endswith('.json') else 'prom'
+            metrics.export(args.metrics, format_type)
+
+def run(args):
+    """Run the application for the parsed command-line arguments.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+    """
+    book_finder = get_book_finder(args.mock, args.dedupe, args.api_url, args.record, args.replay)
+    favorites_manager = FavoritesManager(get_favorites_file(args.favorites_file))
 
     if args.favorites:
         view_favorites(favorites_manager)
     elif args.export:
         export_favorites(favorites_manager, args.export, args.filename)
+    elif args.crawl:
+        run_crawl(book_finder, args.crawl, args.catalog, args.quota)
+    elif args.live:
+        live_search(book_finder, favorites_manager, lang=args.lang)
     elif any([args.title, args.author, args.lang]):
         search_books(book_finder, favorites_manager, title=args.title, author=args.author, lang=args.lang)
     else:
@@ -75,6 +141,8 @@ def main():
             elif choice == "5":
                 console.print("[bold blue]👋 Goodbye! Happy reading![/bold blue]")
                 break
+            elif choice == "6":
+                live_search(book_finder, favorites_manager)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""Tests for the memory-mapped binary favorites store."""
+
+import json
+import struct
+import pytest
+from app.functional.binary_store import (
+    BinaryFavoritesStore, append_records, binary_to_json, json_to_binary, write_store
+)
+from app.functional.book import Book
+from app.functional.favorites import FavoritesManager
+
+
+def make_books(count):
+    return [
+        {
+            'title': f'Book {i}',
+            'authors': ['Shared Author', f'Author {i}'] if i % 2 else [],
+            'description': f'Description {i} ✓' if i % 3 else None,
+            'published_date': str(1990 + i),
+            'info_link': f'https://example.com/{i}',
+            'note': None,
+            'language': 'en',
+            'added_at': f'2024-01-{i + 1:02d}T00:00:00',
+        }
+        for i in range(count)
+    ]
+
+
+def test_round_trip(tmp_path):
+    books = make_books(20)
+    path = str(tmp_path / 'favorites.jbf')
+    assert write_store(path, books) == 20
+
+    store = BinaryFavoritesStore(path)
+    try:
+        assert len(store) == 20
+        assert list(store) == books
+        assert store[-1] == books[-1]
+        assert store[2:4] == books[2:4]
+        assert store.title_and_authors(1) == ('Book 1', ['Shared Author', 'Author 1'])
+    finally:
+        store.close()
+
+
+def test_empty_store(tmp_path):
+    path = str(tmp_path / 'favorites.jbf')
+    write_store(path, [])
+    store = BinaryFavoritesStore(path)
+    try:
+        assert len(store) == 0
+        assert list(store) == []
+    finally:
+        store.close()
+
+
+def test_append_records_keeps_existing_records(tmp_path):
+    books = make_books(10)
+    path = str(tmp_path / 'favorites.jbf')
+    write_store(path, books[:6])
+
+    assert append_records(BinaryFavoritesStore(path), books[6:]) == 10
+    store = BinaryFavoritesStore(path)
+    try:
+        assert list(store) == books
+    finally:
+        store.close()
+
+
+def test_json_conversion(tmp_path):
+    books = make_books(5)
+    json_path = tmp_path / 'favorites.json'
+    json_path.write_text(json.dumps(books), encoding='utf-8')
+
+    json_to_binary(str(json_path), str(tmp_path / 'favorites.jbf'))
+    binary_to_json(str(tmp_path / 'favorites.jbf'), str(tmp_path / 'back.json'))
+    assert json.loads((tmp_path / 'back.json').read_text(encoding='utf-8')) == books
+
+
+def test_manager_adds_to_binary_store(tmp_path):
+    path = str(tmp_path / 'favorites.jbf')
+    write_store(path, make_books(3))
+    manager = FavoritesManager(path, str(tmp_path / 'recent.json'))
+    book = Book('New Book', ['Someone'], 'About it', '2001', 'https://example.com/new')
+
+    assert manager.add_favorite(book, 'great')
+    assert not manager.add_favorite(book, 'great')
+    assert isinstance(manager.favorites, BinaryFavoritesStore)
+
+    reopened = FavoritesManager(path, str(tmp_path / 'recent.json'))
+    assert [b.title for b in reopened.get_favorites()] == ['Book 0', 'Book 1', 'Book 2', 'New Book']
+    assert reopened.get_favorites()[-1].note == 'great'
+
+
+def test_truncated_or_corrupt_store_is_rejected(tmp_path):
+    path = tmp_path / 'favorites.jbf'
+    write_store(str(path), make_books(5))
+    data = path.read_bytes()
+
+    for broken in (data[:-4], data[:len(data) // 2], data[:40],
+                   data[:24] + struct.pack('<Q', len(data)) + data[32:]):
+        path.write_bytes(broken)
+        with pytest.raises(ValueError):
+            BinaryFavoritesStore(str(path))
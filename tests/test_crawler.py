@@ -0,0 +1,125 @@
+"""Tests for the resumable catalog crawl job."""
+
+import json
+import threading
+import requests
+from app.functional.crawler import CRAWL_PAGE_SIZE, CrawlJob
+
+
+class FakeFinder:
+    """Finder serving fixed result counts per seed, with optional failures."""
+
+    def __init__(self, totals, failures=None):
+        self.totals = totals
+        self.failures = failures or {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def build_params(self, query, start_index=0, max_results=None):
+        return {'q': query, 'startIndex': start_index, 'maxResults': max_results}
+
+    def fetch_volumes(self, params):
+        seed, start = params['q'], params['startIndex']
+        with self.lock:
+            self.calls.append((seed, start))
+            status = self.failures.get((seed, start))
+            if status:
+                self.failures[(seed, start)] = None
+        if status:
+            response = requests.Response()
+            response.status_code = status
+            raise requests.exceptions.HTTPError(f'{status} error', response=response)
+        end = min(start + params['maxResults'], self.totals[seed])
+        # Every tenth volume is shared between seeds
+        items = [{'id': f'shared{i}' if i % 10 == 0 else f'{seed}{i}'} for i in range(start, end)]
+        return {'totalItems': self.totals[seed], 'items': items} if items else {'totalItems': self.totals[seed]}
+
+
+def read_catalog(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_crawl_all_seeds(tmp_path):
+    finder = FakeFinder({'dune': 100, 'tolkien': 50})
+    catalog = str(tmp_path / 'catalog.jsonl')
+    stats = CrawlJob(finder, ['dune', 'tolkien', 'dune', ' '], catalog, workers=4).run()
+
+    ids = [v['id'] for v in read_catalog(catalog)]
+    assert len(ids) == len(set(ids)) == 145
+    assert stats['fetched'] == 150 and stats['added'] == 145
+    assert stats['seeds_done'] == stats['seeds_total'] == 2
+    assert sorted(finder.calls) == [('dune', 0), ('dune', 40), ('dune', 80), ('dune', 120),
+                                    ('tolkien', 0), ('tolkien', 40), ('tolkien', 80)]
+
+
+def test_short_pages_do_not_shift_the_next_page(tmp_path):
+    class ShortPageFinder(FakeFinder):
+        """Finder that leaves some volumes out of full pages, like the live API."""
+
+        def fetch_volumes(self, params):
+            data = super().fetch_volumes(params)
+            data['items'] = [item for item in data.get('items', []) if not item['id'].endswith('3')]
+            return data
+
+    finder = ShortPageFinder({'dune': 100})
+    catalog = str(tmp_path / 'catalog.jsonl')
+    stats = CrawlJob(finder, ['dune'], catalog).run()
+
+    assert finder.calls == [('dune', 0), ('dune', 40), ('dune', 80), ('dune', 120)]
+    assert stats['fetched'] == 90 and stats['seeds_done'] == 1
+
+
+def test_resume_after_quota(tmp_path):
+    catalog = str(tmp_path / 'catalog.jsonl')
+    totals = {'dune': 100, 'tolkien': 50}
+    first = FakeFinder(totals)
+    stats = CrawlJob(first, ['dune', 'tolkien'], catalog, workers=1, quota=3).run()
+    assert stats['requests'] == 3 and stats['remaining_quota'] == 0
+    assert stats['seeds_done'] == 0
+
+    second = FakeFinder(totals)
+    job = CrawlJob(second, ['dune', 'tolkien'], catalog, workers=2, quota=100)
+    stats = job.run()
+    assert not set(first.calls) & set(second.calls)
+    assert stats['seeds_done'] == 2
+    assert stats['remaining_quota'] == 100 - len(first.calls) - len(second.calls)
+    assert len(read_catalog(catalog)) == 145
+
+    third = FakeFinder(totals)
+    assert CrawlJob(third, ['dune', 'tolkien'], catalog).run()['requests'] == 0
+    assert third.calls == []
+
+
+def test_retries_count_against_quota(tmp_path):
+    catalog = str(tmp_path / 'catalog.jsonl')
+    finder = FakeFinder({'dune': 30}, failures={('dune', 0): 503})
+    stats = CrawlJob(finder, ['dune'], catalog, retry_delay=0).run()
+    assert finder.calls == [('dune', 0), ('dune', 0), ('dune', 40)]
+    assert stats['requests'] == 3 and stats['seeds_done'] == 1
+
+
+def test_failed_requests_are_checkpointed(tmp_path):
+    catalog = str(tmp_path / 'catalog.jsonl')
+    finder = FakeFinder({'dune': 30}, failures={('dune', 0): 404})
+    stats = CrawlJob(finder, ['dune'], catalog, retry_delay=0).run()
+    assert stats['requests'] == 1 and stats['seeds_done'] == 0
+
+    job = CrawlJob(FakeFinder({'dune': 30}), ['dune'], catalog, quota=10)
+    assert job.remaining_quota() == 9
+    assert job.run()['seeds_done'] == 1
+
+
+def test_truncated_catalog_line_is_refetched(tmp_path):
+    catalog = tmp_path / 'catalog.jsonl'
+    CrawlJob(FakeFinder({'dune': 100}), ['dune'], str(catalog), quota=1).run()
+    lines = catalog.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == CRAWL_PAGE_SIZE
+    # Simulate an interruption while the page was written, before the checkpoint advanced
+    catalog.write_text('\n'.join(lines[:-1]) + '\n' + lines[-1][:10], encoding='utf-8')
+    checkpoint = tmp_path / 'catalog.checkpoint.json'
+    checkpoint.write_text(json.dumps({'seeds': {'dune': {'next_index': 0, 'done': False}}, 'requests': 1}))
+
+    CrawlJob(FakeFinder({'dune': 100}), ['dune'], str(catalog)).run()
+    ids = [v['id'] for v in read_catalog(str(catalog))]
+    assert len(ids) == len(set(ids)) == 100
@@ -0,0 +1,104 @@
+"""Tests for near-duplicate detection and merging."""
+
+from app.functional.book_finder_base import BookFinderBase
+from app.functional.dedup import (
+    author_surname, deduplicate, find_duplicates, split_title
+)
+
+
+def book(title, authors, description='', published_date='', note=None):
+    return {
+        'title': title,
+        'authors': authors,
+        'description': description,
+        'published_date': published_date,
+        'info_link': '',
+        'note': note,
+    }
+
+
+def test_split_title_keeps_volume_and_subtitle():
+    assert split_title('The Lord of the Rings: The Two Towers') == ('lord of the rings', 'two towers')
+    assert split_title('Dune (Volume 2)') == ('dune volume 2', '')
+    assert split_title('Dune (40th Anniversary Edition)') == ('dune', '')
+
+
+def test_author_surname():
+    assert author_surname('Tolkien, J.R.R.') == 'tolkien'
+    assert author_surname('J. R. R. Tolkien') == 'tolkien'
+    assert author_surname('') == ''
+
+
+def test_editions_are_grouped():
+    records = [
+        book('Dune', ['Frank Herbert'], published_date='1965'),
+        book('The Hobbit', ['Tolkien, J.R.R.']),
+        book('Dune (40th Anniversary Edition)', ['Herbert, Frank'], published_date='2005'),
+        book('Dune: A Novel', ['Frank Herbert']),
+        book('Hobbit: Or There and Back Again', ['J. R. R. Tolkien']),
+    ]
+    assert find_duplicates(records) == [[0, 2, 3], [1, 4]]
+
+
+def test_different_works_are_not_grouped():
+    records = [
+        book('The Lord of the Rings: The Fellowship of the Ring', ['J. R. R. Tolkien']),
+        book('The Lord of the Rings: The Two Towers', ['J. R. R. Tolkien']),
+        book('Dune (Volume 1)', ['Frank Herbert']),
+        book('Dune (Volume 2)', ['Frank Herbert']),
+        book('Untitled', []),
+        book('Untitled', []),
+        book('Dune', ['Brian Herbert', 'Kevin J. Anderson']),
+        book('Dune', ['Someone Else']),
+    ]
+    assert find_duplicates(records) == []
+
+
+def test_similar_descriptions_with_shared_author_are_grouped():
+    description = ' '.join(f'word{i}' for i in range(40))
+    records = [
+        book('Foundation', ['Isaac Asimov'], description),
+        book('The Foundation Trilogy Book One', ['Asimov, Isaac'], description),
+        book('I, Robot', ['Isaac Asimov'], 'robots ' * 40),
+    ]
+    assert find_duplicates(records) == [[0, 1]]
+
+
+def test_deduplicate_merges_fields_and_notes():
+    records = [
+        book('Dune', ['Frank Herbert'], note='classic'),
+        book('Neuromancer', ['William Gibson']),
+        book('Dune (Reprint)', ['Frank Herbert'], 'Desert planet saga', '1990', note='reread'),
+    ]
+    merged, report = deduplicate(records)
+
+    assert [b['title'] for b in merged] == ['Dune (Reprint)', 'Neuromancer']
+    assert merged[0]['note'] == 'classic | reread'
+    assert (report.original_count, report.merged_count, len(report.groups)) == (3, 2, 1)
+
+
+def test_parallel_signatures_match_serial(monkeypatch):
+    import app.functional.dedup as dedup
+    records = [book(f'Title {i % 50}', [f'Author {i % 50}']) for i in range(200)]
+    serial = find_duplicates(records, workers=1)
+    monkeypatch.setattr(dedup, 'PARALLEL_THRESHOLD', 100)
+    monkeypatch.setattr(dedup, 'CHUNK_SIZE', 64)
+    assert find_duplicates(records, workers=2) == serial
+    assert len(serial) == 50
+
+
+def test_deduplicated_response_keeps_item_count(monkeypatch, tmp_path):
+    monkeypatch.setenv('BOOK_FINDER_LOG_FILE', str(tmp_path / 'book_finder.log'))
+    monkeypatch.setenv('BOOK_FINDER_LOG_CONSOLE', 'off')
+
+    class Finder(BookFinderBase):
+        def search_books(self, query, title=None, author=None, lang=None, start_index=0, max_results=None):
+            return []
+
+    items = [{'volumeInfo': {'title': title, 'authors': ['Frank Herbert']}}
+             for title in ('Dune', 'Dune: A Novel', 'Children of Dune')]
+    books = Finder(dedupe_results=True).handle_response({'items': items})
+
+    assert [b.title for b in books] == ['Dune', 'Children of Dune']
+    assert books.item_count == 3
+    assert books.copy().item_count == 3
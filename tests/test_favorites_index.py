@@ -0,0 +1,94 @@
+"""Tests for the incremental sort and facet index over favorites."""
+
+import random
+from app.functional.book import Book
+from app.functional.favorites import FavoritesManager
+from app.functional.favorites_index import SORT_KEYS, FavoritesIndex
+
+
+def favorite(i, authors=None, year=None, language='en'):
+    return {
+        'title': f'Title {i:03d}',
+        'authors': authors if authors is not None else [f'Author {i % 3}'],
+        'published_date': f'{year or 2000 + i % 5}-01-01',
+        'language': language,
+        'added_at': f'2024-01-01T00:00:{i % 60:02d}',
+    }
+
+
+def titles(records):
+    return [r['title'] for r in records]
+
+
+def all_pages(index, **view):
+    result, page = [], 0
+    while True:
+        records, total = index.page(page=page, page_size=7, **view)
+        if not records:
+            return result, total
+        result.extend(records)
+        page += 1
+
+
+def test_paging_ascending_and_descending():
+    index = FavoritesIndex([favorite(i) for i in (3, 1, 2, 0, 4)])
+
+    records, total = index.page('title', page=0, page_size=2)
+    assert titles(records) == ['Title 000', 'Title 001'] and total == 5
+    records, _ = index.page('title', page=2, page_size=2)
+    assert titles(records) == ['Title 004']
+    records, _ = index.page('title', descending=True, page=0, page_size=2)
+    assert titles(records) == ['Title 004', 'Title 003']
+    records, _ = index.page('title', descending=True, page=2, page_size=2)
+    assert titles(records) == ['Title 000']
+    assert index.page('title', page=3, page_size=2) == ([], 5)
+
+
+def test_facets_and_counts():
+    records = [favorite(0, ['Ann']), favorite(1, ['Ann', 'Bob']), favorite(2, [], language=None)]
+    index = FavoritesIndex(records)
+
+    assert index.facet_counts('author') == [('Ann', 2), ('Bob', 1), ('Unknown', 1)]
+    assert index.facet_counts('language') == [('en', 2), ('Unknown', 1)]
+    assert titles(index.page('title', facet='author', value='Ann')[0]) == ['Title 000', 'Title 001']
+    assert index.page('title', facet='author', value='Nobody') == ([], 0)
+
+
+def test_incremental_changes_match_rebuild():
+    rng = random.Random(7)
+    index = FavoritesIndex()
+    current = []
+    for i in range(300):
+        if current and rng.random() < 0.3:
+            title = rng.choice(current)['title']
+            removed = index.remove_title(title)
+            assert removed == sum(1 for r in current if r['title'] == title)
+            current = [r for r in current if r['title'] != title]
+        else:
+            record = favorite(rng.randrange(100), [f'Author {rng.randrange(4)}'], 1990 + rng.randrange(6))
+            index.add(record)
+            current.append(record)
+
+    rebuilt = FavoritesIndex(current)
+    assert len(index) == len(current)
+    for sort in SORT_KEYS:
+        for descending in (False, True):
+            assert all_pages(index, sort=sort, descending=descending) == \
+                all_pages(rebuilt, sort=sort, descending=descending)
+            ordered, _ = all_pages(index, sort=sort, descending=descending)
+            keys = [SORT_KEYS[sort](r) for r in ordered]
+            assert keys == sorted(keys, reverse=descending)
+    for facet in ('author', 'year', 'language'):
+        assert index.facet_counts(facet) == rebuilt.facet_counts(facet)
+
+
+def test_manager_keeps_index_in_sync(tmp_path):
+    manager = FavoritesManager(str(tmp_path / 'favorites.json'), str(tmp_path / 'recent.json'))
+    manager.add_favorite(Book('B', ['Ann'], '', '2001', 'b'))
+    assert manager.favorites_page()[1] == 1
+
+    manager.add_favorite(Book('A', ['Bob'], '', '1999', 'a', language='fr'))
+    manager.remove_favorite('B')
+    books, total = manager.favorites_page(sort='year')
+    assert [b.title for b in books] == ['A'] and total == 1
+    assert manager.facet_counts('language') == [('fr', 1)]
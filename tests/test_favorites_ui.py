@@ -0,0 +1,24 @@
+"""Tests for the favorites screens."""
+
+from app.functional.book import Book
+from app.functional.favorites import FavoritesManager
+from app.ui import favorites as favorites_ui
+
+
+def test_emptied_facet_returns_to_all_favorites(tmp_path, monkeypatch):
+    manager = FavoritesManager(str(tmp_path / 'favorites.json'), str(tmp_path / 'recent.json'))
+    manager.add_favorite(Book('A', ['Ann'], '', '2001', 'a'))
+    manager.add_favorite(Book('B', ['Bob'], '', '2002', 'b'))
+    # Browse Ann's books, remove the only one, then quit from the full list
+    answers = iter(['f', 'author', '1', 'r', '1', 'q'])
+    monkeypatch.setattr(favorites_ui.Prompt, 'ask', lambda *args, **kwargs: next(answers))
+    printed = []
+    monkeypatch.setattr(favorites_ui.console, 'print', lambda *args, **kwargs: printed.append(args))
+
+    favorites_ui.view_favorites(manager)
+
+    assert next(answers, None) is None
+    assert [b.title for b in manager.get_favorites()] == ['B']
+    assert ('[yellow]No favorite books yet![/yellow]',) not in printed
+    tables = [args[0] for args in printed if args and isinstance(args[0], favorites_ui.Table)]
+    assert tables[-1].title == 'Favorites sorted by title - page 1/1 (1 books)'
@@ -0,0 +1,96 @@
+"""Tests for recording, replaying and serving Google Books API responses."""
+
+import json
+import pytest
+import requests
+from app.functional.http_replay import Cassette, ReplayAdapter, StubServer, request_key, use_cassette
+from app.google_books_finder import GoogleBooksFinder
+
+VOLUMES = '/books/v1/volumes'
+BODY = json.dumps({'totalItems': 1, 'items': [{'volumeInfo': {'title': 'Dune', 'authors': ['Frank Herbert']}}]})
+
+
+@pytest.fixture
+def cassette(tmp_path, monkeypatch):
+    monkeypatch.setenv('BOOK_FINDER_LOG_FILE', str(tmp_path / 'book_finder.log'))
+    monkeypatch.setenv('BOOK_FINDER_LOG_CONSOLE', 'off')
+    cassette = Cassette(str(tmp_path / 'cassettes'))
+    cassette.save(f'{VOLUMES}?q=dune', 200, {'Content-Type': 'application/json'}, BODY.encode('utf-8'))
+    return cassette
+
+
+@pytest.fixture
+def server(cassette):
+    servers = []
+
+    def start(**options):
+        stub = StubServer(cassette, **options)
+        stub.start()
+        servers.append(stub)
+        return stub
+
+    yield start
+    for stub in servers:
+        stub.stop()
+
+
+def test_request_key_ignores_host_and_parameter_order():
+    live = 'https://www.googleapis.com/books/v1/volumes?q=dune&maxResults=10'
+    assert request_key(live) == request_key('http://127.0.0.1:8765/books/v1/volumes?maxResults=10&q=dune')
+    assert request_key(live) != request_key('https://www.googleapis.com/books/v1/volumes?q=dune&maxResults=20')
+    assert request_key(live) != request_key('https://www.googleapis.com/books/v2/volumes?q=dune&maxResults=10')
+
+
+def test_cassette_round_trip(cassette):
+    cassette.save(f'{VOLUMES}?q=tolkien', 200,
+                  {'Content-Type': 'application/json', 'Content-Encoding': 'gzip', 'Content-Length': '9'},
+                  '{"title": "Tolkien ✓"}'.encode('utf-8'))
+
+    entry = Cassette(cassette.directory).load(f'https://www.googleapis.com{VOLUMES}?q=tolkien')
+    assert entry['status'] == 200
+    assert entry['headers'] == {'Content-Type': 'application/json'}
+    assert entry['body'] == '{"title": "Tolkien ✓"}'
+    assert cassette.load(f'{VOLUMES}?q=unknown') is None
+
+
+def test_replay_adapter_answers_from_cassette(cassette):
+    session = requests.Session()
+    session.mount('https://', ReplayAdapter(cassette))
+
+    response = session.get(f'https://www.googleapis.com{VOLUMES}', params={'q': 'dune'})
+    assert response.status_code == 200
+    assert response.json()['items'][0]['volumeInfo']['title'] == 'Dune'
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get(f'https://www.googleapis.com{VOLUMES}', params={'q': 'unrecorded'})
+
+
+def test_finder_replays_cassette(cassette):
+    finder = GoogleBooksFinder()
+    use_cassette(finder, cassette.directory)
+
+    assert [b.title for b in finder.search_books('dune')] == ['Dune']
+    assert finder.search_books('unrecorded') == []
+
+
+def test_stub_server_serves_recorded_responses(server):
+    stub = server()
+    finder = GoogleBooksFinder()
+    finder.api_url = f'{stub.url}{VOLUMES}'
+
+    assert [b.title for b in finder.search_books('dune')] == ['Dune']
+    assert requests.get(f'{stub.url}{VOLUMES}', params={'q': 'unrecorded'}).status_code == 404
+
+
+def test_stub_server_simulates_errors(server):
+    stub = server(error_rate=1.0, seed=1)
+    response = requests.get(f'{stub.url}{VOLUMES}', params={'q': 'dune'})
+    assert response.status_code == 503
+    assert response.json()['error']['code'] == 503
+
+
+def test_stub_server_throttles_above_rate_limit(server):
+    stub = server(rate_limit=0.5, burst=2)
+    responses = [requests.get(f'{stub.url}{VOLUMES}', params={'q': 'dune'}) for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert responses[-1].headers['Retry-After'] == '1'
@@ -0,0 +1,104 @@
+"""Tests for the debounced search-as-you-type engine."""
+
+import threading
+import time
+from app.functional.book import Book
+from app.functional.live_search import IncrementalSearch
+
+
+class FakeFinder:
+    """Finder returning one book per query, optionally blocking until released."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def search_books(self, query, title=None, author=None, lang=None, start_index=0, max_results=None):
+        with self.lock:
+            self.calls.append(query)
+        time.sleep(self.delays.get(query, 0))
+        return [Book(f'{query} book', ['Someone'], '', '', f'https://example.com/{query}')]
+
+
+def wait_for(search, predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        snapshot = search.snapshot()
+        if predicate(snapshot):
+            return snapshot
+        time.sleep(0.01)
+    raise AssertionError(f'condition not met, last snapshot {search.snapshot()}')
+
+
+def test_typing_is_debounced():
+    finder = FakeFinder()
+    search = IncrementalSearch(finder, debounce=0.05)
+    try:
+        for text in ('du', 'dun', 'dune'):
+            search.update(text)
+        _, query, books, _ = wait_for(search, lambda s: not s[3])
+        assert finder.calls == ['dune']
+        assert query == 'dune' and [b.title for b in books] == ['dune book']
+    finally:
+        search.close()
+
+
+def test_superseded_results_are_discarded():
+    finder = FakeFinder(delays={'slow': 0.3})
+    search = IncrementalSearch(finder, debounce=0)
+    try:
+        search.update('slow')
+        wait_for(search, lambda s: 'slow' in finder.calls)
+        search.update('fast')
+        _, query, books, _ = wait_for(search, lambda s: s[1] == 'fast' and not s[3])
+        assert [b.title for b in books] == ['fast book']
+        time.sleep(0.4)
+        _, query, books, _ = search.snapshot()
+        assert query == 'fast' and [b.title for b in books] == ['fast book']
+    finally:
+        search.close()
+
+
+def test_local_prefix_results_are_shown_while_pending():
+    finder = FakeFinder(delays={'dune book': 0.3})
+    search = IncrementalSearch(finder, debounce=0)
+    try:
+        search.update('dune')
+        wait_for(search, lambda s: s[1] == 'dune' and not s[3])
+        search.update('dune book')
+        _, query, books, pending = search.snapshot()
+        assert query == 'dune book' and pending
+        assert [b.title for b in books] == ['dune book']
+        search.update('dune xyz')
+        assert search.snapshot()[2] == []
+    finally:
+        search.close()
+
+
+def test_exact_repeat_is_served_from_cache():
+    finder = FakeFinder()
+    search = IncrementalSearch(finder, debounce=0)
+    try:
+        search.update('dune')
+        wait_for(search, lambda s: s[1] == 'dune' and not s[3])
+        search.update('du')
+        wait_for(search, lambda s: s[1] == 'du' and not s[3])
+        search.update('dune')
+        _, query, books, pending = search.snapshot()
+        assert query == 'dune' and not pending and [b.title for b in books] == ['dune book']
+        time.sleep(0.05)
+        assert finder.calls == ['dune', 'du']
+    finally:
+        search.close()
+
+
+def test_short_queries_are_not_sent():
+    finder = FakeFinder()
+    search = IncrementalSearch(finder, debounce=0, min_chars=3)
+    try:
+        search.update('du')
+        time.sleep(0.05)
+        assert finder.calls == [] and not search.snapshot()[3]
+    finally:
+        search.close()
@@ -0,0 +1,47 @@
+"""Tests for the logging configuration."""
+
+import logging
+from app.functional import logging_config
+from app.functional.logging_config import (
+    check_level, check_sample_rate, console_suspended, get_logger, setup_logging, shutdown_logging
+)
+
+
+def test_check_level():
+    assert check_level('debug', 'INFO', 'X') == ('DEBUG', None)
+    level, problem = check_level('verbose', 'INFO', 'BOOK_FINDER_LOG_LEVEL')
+    assert level == 'INFO' and 'verbose' in problem
+    assert check_level('loud', None, 'component')[0] is None
+
+
+def test_check_sample_rate():
+    assert check_sample_rate('0.25') == (0.25, None)
+    assert check_sample_rate('abc')[0] == 1.0
+    assert check_sample_rate(5)[0] == 1.0
+    assert check_sample_rate(None)[0] == 1.0
+
+
+def test_invalid_settings_fall_back(tmp_path, monkeypatch):
+    shutdown_logging()
+    monkeypatch.setenv('BOOK_FINDER_LOG_LEVEL', 'verbose')
+    monkeypatch.setenv('BOOK_FINDER_LOG_SAMPLE_RATE', 'often')
+    try:
+        setup_logging(log_file=str(tmp_path / 'app.log'), console_level='off')
+        assert logging.getLogger(logging_config.ROOT_LOGGER).level == logging.INFO
+    finally:
+        shutdown_logging()
+    assert 'verbose' in (tmp_path / 'app.log').read_text(encoding='utf-8')
+
+
+def test_console_output_is_held_while_suspended(tmp_path, capsys):
+    shutdown_logging()
+    listener = setup_logging(log_file=str(tmp_path / 'app.log'), console_level='WARNING')
+    try:
+        with console_suspended():
+            get_logger('test').warning('request failed')
+            listener.queue.join()
+            assert 'request failed' not in capsys.readouterr().err
+        assert 'request failed' in capsys.readouterr().err
+    finally:
+        shutdown_logging()
+    assert 'request failed' in (tmp_path / 'app.log').read_text(encoding='utf-8')
@@ -0,0 +1,24 @@
+"""Tests for the metrics registry."""
+
+from app.functional.metrics import THROUGHPUT_BUCKETS, MetricsRegistry
+
+
+def test_cache_hit_ratio_is_exported():
+    registry = MetricsRegistry()
+    registry.inc('cache_hits_total', cache='search')
+    registry.inc('cache_misses_total', 3, cache='search')
+
+    assert registry.cache_hit_ratio('search') == 0.25
+    assert 'cache_hit_ratio{cache="search"} 0.25' in registry.to_prometheus().splitlines()
+    assert registry.to_dict()['gauges']['cache_hit_ratio'] == [{'labels': {'cache': 'search'}, 'value': 0.25}]
+
+
+def test_histogram_buckets():
+    registry = MetricsRegistry()
+    registry.observe('export_books_per_second', 2500, buckets=THROUGHPUT_BUCKETS)
+    registry.observe('parse_duration_seconds', 0.003)
+
+    lines = registry.to_prometheus().splitlines()
+    assert 'export_books_per_second_bucket{le="1000"} 0' in lines
+    assert 'export_books_per_second_bucket{le="5000"} 1' in lines
+    assert 'parse_duration_seconds_bucket{le="0.005"} 1' in lines
@@ -0,0 +1,84 @@
+"""Tests for the background search prefetcher."""
+
+import threading
+import time
+from app.functional.book import Book
+from app.functional.prefetch import Prefetcher
+
+
+class SlowFinder:
+    """Finder returning a full page for every search after a fixed delay."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def search_books(self, query, title=None, author=None, lang=None, start_index=0, max_results=None):
+        with self.lock:
+            self.calls.append((query, title, author, start_index))
+        time.sleep(self.delay)
+        return [Book(f'{query} {start_index + i}', ['Author'], '', '', '') for i in range(max_results)]
+
+
+def test_pages_are_cached():
+    finder = SlowFinder()
+    prefetcher = Prefetcher(finder, page_size=5)
+    try:
+        first = prefetcher.get_page(query='dune', page=0)
+        assert prefetcher.get_page(query='dune', page=0) is first
+        assert prefetcher.is_full_page(first)
+        assert finder.calls == [('dune', None, None, 0)]
+    finally:
+        prefetcher.shutdown()
+
+
+def test_cache_is_bounded():
+    prefetcher = Prefetcher(SlowFinder(), page_size=1, max_cached=3)
+    try:
+        for page in range(10):
+            prefetcher.get_page(query='dune', page=page)
+        assert len(prefetcher._futures) == 3
+    finally:
+        prefetcher.shutdown()
+
+
+def test_warm_ups_do_not_delay_pages():
+    finder = SlowFinder(delay=0.2)
+    prefetcher = Prefetcher(finder, page_size=10, warm_delay=0.05)
+    try:
+        prefetcher.get_page(query='dune', page=0)
+        for i in range(8):
+            prefetcher.warm_related(Book(f'Title {i}', [f'Author {i}'], '', '', ''))
+        prefetcher.prefetch_page(query='dune', page=1)
+        start = time.perf_counter()
+        prefetcher.get_page(query='dune', page=1)
+        assert time.perf_counter() - start < 0.35
+    finally:
+        prefetcher.shutdown()
+
+
+def test_only_the_book_left_on_screen_is_warmed():
+    finder = SlowFinder()
+    prefetcher = Prefetcher(finder, warm_delay=0.1)
+    try:
+        for i in range(5):
+            prefetcher.warm_related(Book(f'Title {i}', [f'Author {i}'], '', '', ''))
+        time.sleep(0.3)
+        assert set(finder.calls) == {(None, None, 'Author 4', 0), (None, 'Title 4', None, 0)}
+    finally:
+        prefetcher.shutdown()
+
+
+def test_needed_search_jumps_ahead_of_queued_warm_ups():
+    finder = SlowFinder(delay=0.2)
+    prefetcher = Prefetcher(finder, warm_delay=0)
+    try:
+        prefetcher.submit(query='busy', speculative=True)
+        prefetcher.submit(author='Frank Herbert', speculative=True)
+        time.sleep(0.05)
+        start = time.perf_counter()
+        prefetcher.get_page(author='Frank Herbert')
+        assert time.perf_counter() - start < 0.35
+    finally:
+        prefetcher.shutdown()
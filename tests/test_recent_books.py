@@ -0,0 +1,52 @@
+"""Tests for the recently viewed books store."""
+
+from app.functional.recent_books import RecentBooks, book_key
+
+
+def book(title, link=''):
+    return {'title': title, 'authors': ['Someone'], 'info_link': link}
+
+
+def titles(recent):
+    return [b['title'] for b in recent]
+
+
+def test_book_key_uses_volume_id():
+    search_link = 'http://books.google.com.ph/books?id=fFayzgEACAAJ&dq=One+Piece&hl=&source=gbs_api'
+    other_search = 'https://books.google.com/books?id=fFayzgEACAAJ&dq=Oda&source=gbs_api'
+    play_link = 'https://play.google.com/store/books/details?id=fFayzgEACAAJ&source=gbs_api'
+    keys = {book_key(book('One Piece', link)) for link in (search_link, other_search, play_link)}
+    assert keys == {('id', 'fFayzgEACAAJ')}
+    assert book_key(book('Test', 'http://example.com/test-book')) == ('link', 'http://example.com/test-book')
+    assert book_key(book('Dune')) == book_key({'title': 'DUNE', 'authors': ['Someone']})
+
+
+def test_same_volume_from_different_searches_is_one_entry():
+    recent = RecentBooks(10)
+    assert recent.add(book('One Piece', 'http://books.google.com/books?id=abc&dq=One+Piece'))
+    assert recent.add(book('Dune', 'http://books.google.com/books?id=dune'))
+    assert recent.add(book('One Piece', 'http://books.google.com/books?id=abc&dq=Oda'))
+    assert titles(recent) == ['One Piece', 'Dune']
+    assert recent.to_list()[0]['info_link'].endswith('dq=Oda')
+
+
+def test_move_to_front_and_unchanged_repeat():
+    recent = RecentBooks(10)
+    for title in ('A', 'B', 'C'):
+        recent.add(book(title))
+    assert recent.add(book('A'))
+    assert titles(recent) == ['A', 'C', 'B']
+    assert not recent.add(book('A'))
+    assert book('B') in recent and book('Z') not in recent
+
+
+def test_oldest_books_are_evicted():
+    recent = RecentBooks(3)
+    for title in 'ABCDE':
+        recent.add(book(title))
+    assert titles(recent) == ['E', 'D', 'C'] and len(recent) == 3
+
+
+def test_loading_keeps_order_and_drops_duplicates():
+    recent = RecentBooks(2, [book('C'), book('B'), book('C'), book('A')])
+    assert titles(recent) == ['C', 'B']
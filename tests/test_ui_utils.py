@@ -0,0 +1,29 @@
+"""Tests for terminal input helpers."""
+
+import os
+import sys
+import pytest
+from app.ui.utils import read_key
+
+
+class PipeInput:
+    """Stand-in for stdin reading from a pipe."""
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    def fileno(self):
+        return self.fd
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="reads keys with msvcrt on Windows")
+def test_read_key_decodes_multibyte_characters(monkeypatch):
+    read_fd, write_fd = os.pipe()
+    monkeypatch.setattr(sys, 'stdin', PipeInput(read_fd))
+    try:
+        os.write(write_fd, 'años 📚\r\x7f'.encode('utf-8'))
+        keys = [read_key(timeout=0.1) for _ in range(8)]
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+    assert keys == ['a', 'ñ', 'o', 's', ' ', '📚', 'enter', 'backspace']